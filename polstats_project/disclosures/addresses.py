@@ -0,0 +1,61 @@
+"""Helpers for reading the state out of a free-form disclosure address."""
+import re
+
+# Reports are filed with Utah; any other state counts as out of state
+HOME_STATE = 'UT'
+
+# US state abbreviations
+STATES = (
+    'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
+    'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
+    'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
+    'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
+    'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY', 'DC'
+)
+
+_STATE_CODES = frozenset(STATES)
+
+# Trailing zip code (with the whitespace separating it from the state)
+_ZIP_RE = re.compile(r'\s+\d{5}(?:-\d{4})?$')
+
+# State code optionally followed by a zip code, anchored at the end of the address
+_STATE_RE = re.compile(r'\b(' + '|'.join(STATES) + r')(?:\s+\d{5}(?:-\d{4})?)?\s*$', re.IGNORECASE)
+
+
+def find_state(address):
+    """
+    Locate the state code at the end of an address.
+    Returns (state, start index) or None.
+    """
+    # Fast path: the state is almost always the last two letters before an optional zip
+    tail = address.rstrip()
+    if tail[-1:].isdigit():
+        zip_match = _ZIP_RE.search(tail)
+        if zip_match:
+            tail = tail[:zip_match.start()]
+    code = tail[-2:]
+    if len(code) == 2 and code.isascii() and code.upper() in _STATE_CODES:
+        start = len(tail) - 2
+        # Same rule as \b: the code must not continue a longer word
+        if start == 0 or not (tail[start - 1].isalnum() or tail[start - 1] == '_'):
+            return code.upper(), start
+
+    # Odd formats fall back to the full pattern
+    match = _STATE_RE.search(address)
+    if not match:
+        return None
+    return match.group(1).upper(), match.start()
+
+
+def address_state(address):
+    """Return the state code at the end of an address, or '' if there is none."""
+    if not address:
+        return ''
+    found = find_state(address)
+    return found[0] if found else ''
+
+
+def contribution_state_columns(address):
+    """Return the Contribution state / is_out_of_state column values for an address."""
+    state = address_state(address)
+    return {'state': state, 'is_out_of_state': state not in ('', HOME_STATE)}
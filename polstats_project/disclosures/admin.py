@@ -69,6 +69,7 @@ class ContributionAdmin(admin.ModelAdmin):
     search_fields = ['contributor_name', 'address']
     readonly_fields = ['created_at', 'updated_at']
     raw_id_fields = ['report']
+    list_select_related = ['report']
 
 
 @admin.register(Expenditure)
@@ -92,6 +93,7 @@ class ExpenditureAdmin(admin.ModelAdmin):
     search_fields = ['recipient_name', 'purpose']
     readonly_fields = ['created_at', 'updated_at']
     raw_id_fields = ['report']
+    list_select_related = ['report']
 
 
 class EntityOfficerInline(admin.TabularInline):
@@ -161,6 +163,7 @@ class EntityOfficerAdmin(admin.ModelAdmin):
     ]
     readonly_fields = ['created_at', 'updated_at']
     raw_id_fields = ['entity']
+    list_select_related = ['entity']
 
 
 # ============================================================================
@@ -174,7 +177,7 @@ class LobbyistReportAdmin(admin.ModelAdmin):
         'report_id',
         'principal_name',
         'report_type',
-        'total_expenditures',
+        'total_expenditures_display',
         'submit_date'
     ]
     list_filter = [
@@ -209,6 +212,10 @@ class LobbyistReportAdmin(admin.ModelAdmin):
         }),
     )
 
+    @admin.display(description='Total expenditures', ordering='total_expenditures')
+    def total_expenditures_display(self, obj):
+        return obj.total_expenditures_display
+
 
 @admin.register(LobbyistExpenditure)
 class LobbyistExpenditureAdmin(admin.ModelAdmin):
@@ -228,6 +235,7 @@ class LobbyistExpenditureAdmin(admin.ModelAdmin):
     search_fields = ['recipient_name', 'location', 'purpose']
     readonly_fields = ['created_at', 'updated_at']
     raw_id_fields = ['report']
+    list_select_related = ['report']
 
 
 class LobbyistPrincipalInline(admin.TabularInline):
@@ -301,3 +309,4 @@ class LobbyistPrincipalAdmin(admin.ModelAdmin):
     ]
     readonly_fields = ['created_at', 'updated_at']
     raw_id_fields = ['lobbyist']
+    list_select_related = ['lobbyist']
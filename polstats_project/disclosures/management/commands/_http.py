@@ -0,0 +1,161 @@
+"""Shared HTTP session for the scraping commands."""
+import gzip
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+
+import requests
+from decouple import config
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+# Load custom User-Agent from environment
+USER_AGENT = config('USER_AGENT', default='PolStatsBot/1.0 (Utah Political Finance Data Aggregator)')
+
+# Where fetched pages are cached between runs, and for how long (seconds)
+HTTP_CACHE_DIR = config('HTTP_CACHE_DIR', default='.polstats_http_cache')
+HTTP_CACHE_MAX_AGE = config('HTTP_CACHE_MAX_AGE', default=86400, cast=int)
+
+
+class CachedSession(requests.Session):
+    """
+    Session that keeps successful GET bodies on disk, gzipped and keyed by
+    a hash of the URL, so re-runs and resumed scrapes skip the network.
+
+    Stale entries are revalidated with If-None-Match / If-Modified-Since
+    when the server sent an ETag or Last-Modified; a 304 refreshes the entry
+    and returns the cached body with response.not_modified set.
+    """
+
+    def __init__(self, cache_dir=HTTP_CACHE_DIR, max_age=HTTP_CACHE_MAX_AGE):
+        super().__init__()
+        self.cache_dir = Path(cache_dir)
+        self.configure_cache(max_age=max_age)
+
+    def configure_cache(self, use_cache=True, refresh=False, max_age=HTTP_CACHE_MAX_AGE):
+        """
+        use_cache: read and write the cache at all
+        refresh: ignore cached bodies but store the new ones
+        max_age: seconds a cached body stays fresh (None for no expiry)
+        """
+        self.use_cache = use_cache
+        self.refresh = refresh
+        self.max_age = max_age
+
+    def cache_path(self, url):
+        return self.cache_dir / f'{hashlib.sha1(url.encode()).hexdigest()}.html.gz'
+
+    def is_fresh(self, path):
+        try:
+            age = time.time() - path.stat().st_mtime
+        except FileNotFoundError:
+            return False
+        return self.max_age is None or age <= self.max_age
+
+    def cached_response(self, url, path, not_modified=False):
+        response = requests.Response()
+        response.status_code = 200
+        response.reason = 'OK'
+        response.url = url
+        response._content = gzip.decompress(path.read_bytes())
+        response.from_cache = True
+        response.not_modified = not_modified
+        return response
+
+    def write_atomic(self, path, data, tag):
+        # Write then rename so concurrent workers never read a partial file
+        tmp_path = path.with_name(f'{path.name}.{os.getpid()}.{tag}.tmp')
+        tmp_path.write_bytes(data)
+        os.replace(tmp_path, path)
+
+    def get(self, url, **kwargs):
+        if not self.use_cache:
+            return super().get(url, **kwargs)
+
+        path = self.cache_path(url)
+        if not self.refresh and self.is_fresh(path):
+            return self.cached_response(url, path)
+
+        # Revalidate a stale entry instead of downloading it again
+        meta_path = path.with_suffix('.json')
+        validators = {}
+        if not self.refresh and path.exists():
+            try:
+                validators = json.loads(meta_path.read_text())
+            except (FileNotFoundError, ValueError):
+                validators = {}
+
+        conditional = {}
+        if validators.get('etag'):
+            conditional['If-None-Match'] = validators['etag']
+        if validators.get('last_modified'):
+            conditional['If-Modified-Since'] = validators['last_modified']
+        if conditional:
+            kwargs['headers'] = {**(kwargs.get('headers') or {}), **conditional}
+
+        response = super().get(url, **kwargs)
+
+        if response.status_code == 304 and conditional:
+            os.utime(path)
+            return self.cached_response(url, path, not_modified=True)
+
+        if response.status_code == 200:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            tag = id(response)
+            self.write_atomic(path, gzip.compress(response.content), tag)
+            self.write_atomic(meta_path, json.dumps({
+                'etag': response.headers.get('ETag'),
+                'last_modified': response.headers.get('Last-Modified'),
+            }).encode(), tag)
+        return response
+
+
+def build_session(pool_maxsize=16):
+    """Return a keep-alive session with connection pooling and retries on transient errors."""
+    session = CachedSession()
+    adapter = HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=pool_maxsize,
+        max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504)),
+    )
+    session.mount('https://', adapter)
+    session.headers.update({
+        'User-Agent': USER_AGENT,
+        'Accept-Encoding': 'gzip, deflate',
+    })
+    return session
+
+
+def add_cache_arguments(parser):
+    """Add the --no-cache / --refresh / --max-age options shared by the scraping commands."""
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Do not read or write the on-disk HTTP cache'
+    )
+    parser.add_argument(
+        '--refresh',
+        action='store_true',
+        help='Re-fetch every page and overwrite the cached copy'
+    )
+    parser.add_argument(
+        '--max-age',
+        type=int,
+        default=HTTP_CACHE_MAX_AGE,
+        help=f'Seconds a cached page stays fresh (default: {HTTP_CACHE_MAX_AGE})'
+    )
+
+
+def configure_cache(options):
+    """Apply the cache options from add_cache_arguments() to the shared SESSION."""
+    SESSION.configure_cache(
+        use_cache=not options['no_cache'],
+        refresh=options['refresh'],
+        max_age=options['max_age'],
+    )
+
+
+# Every request goes to disclosures.utah.gov, so one pooled session is reused
+SESSION = build_session()
@@ -0,0 +1,81 @@
+"""Shared helpers for the disclosure import commands."""
+import re
+from datetime import date, datetime
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from itertools import islice
+
+# Rows per INSERT when bulk-creating contributions/expenditures
+BATCH_SIZE = 1000
+
+_EMPTY_VALUES = (None, '')
+
+# Accepted date formats, tried in order: M/D/YYYY, then YYYY-MM-DD
+DATE_FORMATS = ('%m/%d/%Y', '%Y-%m-%d')
+_DATE_PATTERNS = (
+    re.compile(r'(?P<month>\d{1,2})/(?P<day>\d{1,2})/(?P<year>\d{4})', re.ASCII),
+    re.compile(r'(?P<year>\d{4})-(?P<month>\d{1,2})-(?P<day>\d{1,2})', re.ASCII),
+)
+
+# (model attribute, report_info key) for report_info values also stored as columns
+REPORT_INFO_COLUMNS = (
+    ('office', 'Office'),
+    ('district', 'District'),
+    ('party', 'Party'),
+    ('county', 'County'),
+)
+
+
+def chunked(iterable, size=BATCH_SIZE):
+    """Yield lists of at most ``size`` items so only one batch is alive at a time."""
+    iterator = iter(iterable)
+    while batch := list(islice(iterator, size)):
+        yield batch
+
+
+def report_info_columns(report_info):
+    """Return the REPORT_INFO_COLUMNS values of a report_info dict, None for missing keys."""
+    columns = {}
+    for attr, key in REPORT_INFO_COLUMNS:
+        value = report_info.get(key)
+        columns[attr] = None if value is None else str(value)
+    return columns
+
+
+def get_decimal(value):
+    """Convert value to Decimal, returning None for missing or unparseable values."""
+    if isinstance(value, Decimal):
+        return value
+    if value in _EMPTY_VALUES:
+        return None
+    try:
+        # Go through str() so floats keep their short repr instead of the binary expansion
+        return Decimal(str(value))
+    except InvalidOperation:
+        return None
+
+
+@lru_cache(maxsize=1024)
+def parse_date_str(date_str):
+    """
+    Parse a date in one of DATE_FORMATS, returning None if it matches none.
+
+    The usual shapes are split with a precompiled regex rather than strptime,
+    which re-reads its format string on every call. Reports repeat the same
+    handful of dates across many rows, hence the cache.
+    """
+    for pattern in _DATE_PATTERNS:
+        match = pattern.fullmatch(date_str)
+        if match:
+            try:
+                return date(int(match['year']), int(match['month']), int(match['day']))
+            except ValueError:
+                return None
+
+    # Rarer spellings strptime still accepts (e.g. a space-padded day)
+    for fmt in DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt).date()
+        except ValueError:
+            continue
+    return None
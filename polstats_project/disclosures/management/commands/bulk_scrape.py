@@ -57,6 +57,12 @@ class Command(BaseCommand):
             help='Only scrape entities/reports from the last 30 days'
         )
 
+    def existing_ids(self, model, field):
+        """Return the set of ``field`` values already stored for ``model``."""
+        return set(
+            model.objects.values_list(field, flat=True).iterator(chunk_size=2000)
+        )
+
     def scrape_entity_list(self):
         """Scrape list of all registered entities by iterating through entity IDs."""
         self.stdout.write('Discovering entities by ID range...')
@@ -160,13 +166,16 @@ class Command(BaseCommand):
         error_count = 0
         skipped_count = 0
 
+        # Load the known IDs once instead of one EXISTS query per candidate
+        existing_ids = set() if update_existing else self.existing_ids(EntityRegistration, 'entity_id')
+
         for idx, entity in enumerate(entities, 1):
             entity_id = entity['entity_id']
             entity_name = entity.get('name', 'Unknown')
 
             # Check if already exists
             if not update_existing:
-                if EntityRegistration.objects.filter(entity_id=entity_id).exists():
+                if entity_id in existing_ids:
                     self.stdout.write(f'[{idx}/{len(entities)}] Skipping {entity_name} (ID: {entity_id}) - already exists')
                     skipped_count += 1
                     continue
@@ -219,6 +228,8 @@ class Command(BaseCommand):
         error_count = 0
         skipped_count = 0
 
+        existing_ids = set() if update_existing else self.existing_ids(DisclosureReport, 'report_id')
+
         for report_id in range(start_id, max_report_id + 1):
             # Check limit
             if limit and (success_count + skipped_count) >= limit:
@@ -229,7 +240,7 @@ class Command(BaseCommand):
 
             # Check if already exists
             if not update_existing:
-                if DisclosureReport.objects.filter(report_id=str(report_id)).exists():
+                if str(report_id) in existing_ids:
                     skipped_count += 1
                     if skipped_count % 100 == 0:
                         self.stdout.write(f'Skipped {skipped_count} existing reports...')
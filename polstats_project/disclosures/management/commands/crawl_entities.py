@@ -21,6 +21,17 @@ logger = logging.getLogger(__name__)
 # Load custom User-Agent from environment
 USER_AGENT = config('USER_AGENT', default='PolStatsBot/1.0 (Utah Political Finance Data Aggregator)')
 
+# Runs of whitespace collapsed by clean_text (\s already covers \xa0)
+_WS_RE = re.compile(r'\s+')
+
+# Stray NULs dropped by clean_text; PostgreSQL rejects them in text columns
+_CTRL_TRANS = str.maketrans('', '', '\x00')
+
+
+def _is_bold(style):
+    """Officer headers are spans styled inline with font-weight: bold."""
+    return style is not None and 'font-weight: bold' in style
+
 
 class Command(BaseCommand):
     help = 'Continuously crawl entity registration data from Utah disclosures website'
@@ -74,7 +85,7 @@ class Command(BaseCommand):
         """Clean whitespace from text."""
         if not text:
             return ''
-        return ' '.join(text.strip().split())
+        return _WS_RE.sub(' ', text.translate(_CTRL_TRANS)).strip()
 
     def parse_address(self, address_text):
         """Parse address into components."""
@@ -182,7 +193,7 @@ class Command(BaseCommand):
         officers = []
         officer_idx = 0
 
-        all_spans = soup.find_all('span', style=lambda value: value and 'font-weight: bold' in value)
+        all_spans = soup.find_all('span', style=_is_bold)
 
         for span in all_spans:
             span_text = self.clean_text(span.get_text())
@@ -204,7 +215,7 @@ class Command(BaseCommand):
                     if not next_div:
                         break
 
-                    next_span = next_div.find('span', style=lambda value: value and 'font-weight: bold' in value)
+                    next_span = next_div.find('span', style=_is_bold)
                     if next_span and ('Name of' in next_span.get_text()):
                         break
 
@@ -296,8 +307,8 @@ class Command(BaseCommand):
                 entity.officers.all().delete()
 
             # Create officers
-            for officer_data in officers_data:
-                EntityOfficer.objects.create(
+            EntityOfficer.objects.bulk_create([
+                EntityOfficer(
                     entity=entity,
                     name=officer_data.get('name', ''),
                     title=officer_data.get('title', ''),
@@ -312,6 +323,8 @@ class Command(BaseCommand):
                     order=officer_data.get('order', 0),
                     is_treasurer=officer_data.get('is_treasurer', False)
                 )
+                for officer_data in officers_data
+            ], batch_size=500)
 
             return entity, created
 
@@ -37,15 +37,15 @@ class Command(BaseCommand):
         test_reports = DisclosureReport.objects.filter(organization_name__iexact='test')
 
         # Find contributions with "test" in contributor name (case-insensitive exact match)
-        test_contributions = Contribution.objects.filter(contributor_name__iexact='test')
+        test_contributions = Contribution.objects.filter(contributor_name__iexact='test').select_related('report')
 
         # Find expenditures with "test" in recipient name (case-insensitive exact match)
-        test_expenditures = Expenditure.objects.filter(recipient_name__iexact='test')
+        test_expenditures = Expenditure.objects.filter(recipient_name__iexact='test').select_related('report')
 
         # Display what was found
         self.stdout.write(f'Found {test_reports.count()} reports with organization_name="test"')
         if test_reports.exists():
-            for report in test_reports:
+            for report in test_reports.iterator(chunk_size=2000):
                 self.stdout.write(f'  - Report {report.report_id}: {report.organization_name} ({report.title})')
                 contrib_count = report.contributions.count()
                 exp_count = report.expenditures.count()
@@ -12,7 +12,11 @@ import logging
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../../../'))
 
 from utah_disclosures_parser import parse_utah_disclosure
+from ...addresses import contribution_state_columns
 from ...models import DisclosureReport, Contribution, Expenditure
+from ._import_base import (
+    BATCH_SIZE, chunked, get_decimal, parse_date_str, report_info_columns,
+)
 
 
 class Command(BaseCommand):
@@ -86,13 +90,7 @@ class Command(BaseCommand):
         if not date_str or date_str == '--':
             return None
 
-        try:
-            return datetime.strptime(date_str, '%m/%d/%Y').date()
-        except ValueError:
-            try:
-                return datetime.strptime(date_str, '%Y-%m-%d').date()
-            except ValueError:
-                return None
+        return parse_date_str(date_str)
 
     def import_report(self, report_id, skip_existing=False):
         """
@@ -132,6 +130,8 @@ class Command(BaseCommand):
                 # Set organization information
                 report.organization_name = report_info.get('Name', '')
                 report.organization_type = report_info.get('organization_type', '')
+                for attr, value in report_info_columns(report_info).items():
+                    setattr(report, attr, value)
 
                 # Set report period information
                 report.report_type = report_info.get('Report Type', '')
@@ -142,16 +142,16 @@ class Command(BaseCommand):
 
                 # Set balance summary fields
                 balance = data.get('balance_summary', {})
-                report.balance_beginning = self._get_decimal(
+                report.balance_beginning = get_decimal(
                     balance.get('Balance at Beginning of Reporting Period')
                 )
-                report.total_contributions = self._get_decimal(
+                report.total_contributions = get_decimal(
                     balance.get('Total Contributions Received')
                 )
-                report.total_expenditures = self._get_decimal(
+                report.total_expenditures = get_decimal(
                     balance.get('Total Expenditures Made')
                 )
-                report.ending_balance = self._get_decimal(
+                report.ending_balance = get_decimal(
                     balance.get('Ending Balance')
                 )
 
@@ -159,34 +159,39 @@ class Command(BaseCommand):
                 report.save()
 
                 # Import contributions
-                for contrib_data in data.get('contributions', []):
-                    contribution = Contribution(
-                        report=report,
-                        date_received_raw=contrib_data.get('date_received', ''),
-                        date_received=self.parse_date(contrib_data.get('date_received', '')),
-                        contributor_name=contrib_data.get('contributor_name', ''),
-                        address=contrib_data.get('address', ''),
-                        is_in_kind=contrib_data.get('in_kind', False),
-                        is_loan=contrib_data.get('loan', False),
-                        is_amendment=contrib_data.get('amendment', False),
-                        amount=Decimal(str(contrib_data.get('amount', 0)))
-                    )
-                    contribution.save()
+                for batch in chunked(data.get('contributions', [])):
+                    Contribution.objects.bulk_create([
+                        Contribution(
+                            report=report,
+                            date_received_raw=contrib_data.get('date_received', ''),
+                            date_received=self.parse_date(contrib_data.get('date_received', '')),
+                            contributor_name=contrib_data.get('contributor_name', ''),
+                            address=contrib_data.get('address', ''),
+                            **contribution_state_columns(contrib_data.get('address', '')),
+                            is_in_kind=contrib_data.get('in_kind', False),
+                            is_loan=contrib_data.get('loan', False),
+                            is_amendment=contrib_data.get('amendment', False),
+                            amount=Decimal(str(contrib_data.get('amount', 0)))
+                        )
+                        for contrib_data in batch
+                    ], batch_size=BATCH_SIZE)
 
                 # Import expenditures
-                for exp_data in data.get('expenditures', []):
-                    expenditure = Expenditure(
-                        report=report,
-                        date_raw=exp_data.get('date', ''),
-                        date=self.parse_date(exp_data.get('date', '')),
-                        recipient_name=exp_data.get('recipient_name', ''),
-                        purpose=exp_data.get('purpose', ''),
-                        is_in_kind=exp_data.get('in_kind', False),
-                        is_loan=exp_data.get('loan', False),
-                        is_amendment=exp_data.get('amendment', False),
-                        amount=Decimal(str(exp_data.get('amount', 0)))
-                    )
-                    expenditure.save()
+                for batch in chunked(data.get('expenditures', [])):
+                    Expenditure.objects.bulk_create([
+                        Expenditure(
+                            report=report,
+                            date_raw=exp_data.get('date', ''),
+                            date=self.parse_date(exp_data.get('date', '')),
+                            recipient_name=exp_data.get('recipient_name', ''),
+                            purpose=exp_data.get('purpose', ''),
+                            is_in_kind=exp_data.get('in_kind', False),
+                            is_loan=exp_data.get('loan', False),
+                            is_amendment=exp_data.get('amendment', False),
+                            amount=Decimal(str(exp_data.get('amount', 0)))
+                        )
+                        for exp_data in batch
+                    ], batch_size=BATCH_SIZE)
 
                 contrib_count = len(data.get('contributions', []))
                 exp_count = len(data.get('expenditures', []))
@@ -282,9 +287,3 @@ class Command(BaseCommand):
         self.stdout.write(self._log(f'Time elapsed: {elapsed_time:.1f}s'))
         self.stdout.write(self._log(f'Average time per report: {elapsed_time / max(1, total_imported):.2f}s'))
         self.stdout.write(self.style.SUCCESS(self._log('='*60)))
-
-    def _get_decimal(self, value):
-        """Convert value to Decimal, handling None."""
-        if value is None or value == '':
-            return None
-        return Decimal(str(value))
@@ -3,14 +3,33 @@ import os
 from django.core.management.base import BaseCommand, CommandError
 from django.utils import timezone
 from django.db import transaction
-from datetime import datetime
 from decimal import Decimal
 
 # Add the parent directory to the path to import our parser
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../../../'))
 
 from utah_disclosures_parser import parse_utah_disclosure
+from ...addresses import contribution_state_columns
 from ...models import DisclosureReport, Contribution, Expenditure
+from ._import_base import (
+    BATCH_SIZE, chunked, get_decimal, parse_date_str, report_info_columns,
+)
+
+# (model attribute, report_info key, default) for the plain string fields on a report
+_FIELD_MAP = (
+    ('title', 'title', ''),
+    ('organization_name', 'Name', ''),
+    ('organization_type', 'organization_type', ''),
+    ('report_type', 'Report Type', ''),
+)
+
+# (model attribute, report_info key) for the report period dates
+_DATE_FIELD_MAP = (
+    ('begin_date', 'Begin Date'),
+    ('end_date', 'End Date'),
+    ('due_date', 'Due Date'),
+    ('submit_date', 'Submit Date'),
+)
 
 
 class Command(BaseCommand):
@@ -38,16 +57,12 @@ class Command(BaseCommand):
         if not date_str or date_str == '--':
             return None
 
-        try:
-            return datetime.strptime(date_str, '%m/%d/%Y').date()
-        except ValueError:
-            try:
-                return datetime.strptime(date_str, '%Y-%m-%d').date()
-            except ValueError:
-                self.stdout.write(
-                    self.style.WARNING(f'Could not parse date: {date_str}')
-                )
-                return None
+        parsed = parse_date_str(date_str)
+        if parsed is None:
+            self.stdout.write(
+                self.style.WARNING(f'Could not parse date: {date_str}')
+            )
+        return parsed
 
     def extract_report_id(self, url):
         """Extract report ID from URL."""
@@ -85,8 +100,8 @@ class Command(BaseCommand):
 
         # Check if report is blank (all zero transactions)
         balance = data.get('balance_summary', {})
-        total_contrib = self._get_decimal(balance.get('Total Contributions Received')) or Decimal('0')
-        total_expend = self._get_decimal(balance.get('Total Expenditures Made')) or Decimal('0')
+        total_contrib = get_decimal(balance.get('Total Contributions Received')) or Decimal('0')
+        total_expend = get_decimal(balance.get('Total Expenditures Made')) or Decimal('0')
         contributions = data.get('contributions', [])
         expenditures = data.get('expenditures', [])
 
@@ -95,6 +110,24 @@ class Command(BaseCommand):
                 f'Report {report_id} is blank (no contributions or expenditures). Skipping.'
             )
 
+        report_info = data.get('report_info', {})
+        fields = {attr: report_info.get(key, default) for attr, key, default in _FIELD_MAP}
+        fields.update(
+            (attr, self.parse_date(report_info.get(key, ''))) for attr, key in _DATE_FIELD_MAP
+        )
+        fields.update(report_info_columns(report_info))
+        fields.update(
+            source_url=url,
+            report_info=report_info,
+            balance_beginning=get_decimal(
+                balance.get('Balance at Beginning of Reporting Period')
+            ),
+            total_contributions=total_contrib,
+            total_expenditures=total_expend,
+            ending_balance=get_decimal(balance.get('Ending Balance')),
+            last_scraped_at=timezone.now(),
+        )
+
         # Import data in a transaction
         with transaction.atomic():
             # Create or update the main report
@@ -104,74 +137,54 @@ class Command(BaseCommand):
                 # Delete existing contributions and expenditures
                 report.contributions.all().delete()
                 report.expenditures.all().delete()
+                for attr, value in fields.items():
+                    setattr(report, attr, value)
             else:
                 self.stdout.write(f'Creating new report {report_id}...')
-                report = DisclosureReport(report_id=report_id)
-
-            # Set report fields
-            report.source_url = url
-            report_info = data.get('report_info', {})
-            report.title = report_info.get('title', '')
-            report.report_info = report_info
-
-            # Set organization information
-            report.organization_name = report_info.get('Name', '')
-            report.organization_type = report_info.get('organization_type', '')
-
-            # Set report period information
-            report.report_type = report_info.get('Report Type', '')
-            report.begin_date = self.parse_date(report_info.get('Begin Date', ''))
-            report.end_date = self.parse_date(report_info.get('End Date', ''))
-            report.due_date = self.parse_date(report_info.get('Due Date', ''))
-            report.submit_date = self.parse_date(report_info.get('Submit Date', ''))
-
-            # Set balance summary fields (balance was already extracted above for blank check)
-            report.balance_beginning = self._get_decimal(
-                balance.get('Balance at Beginning of Reporting Period')
-            )
-            report.total_contributions = total_contrib
-            report.total_expenditures = total_expend
-            report.ending_balance = self._get_decimal(
-                balance.get('Ending Balance')
-            )
+                report = DisclosureReport(report_id=report_id, **fields)
 
-            report.last_scraped_at = timezone.now()
             report.save()
 
             # Import contributions (contributions was already extracted above for blank check)
             self.stdout.write(f'Importing {len(contributions)} contributions...')
 
-            for contrib_data in contributions:
-                contribution = Contribution(
-                    report=report,
-                    date_received_raw=contrib_data.get('date_received', ''),
-                    date_received=self.parse_date(contrib_data.get('date_received', '')),
-                    contributor_name=contrib_data.get('contributor_name', ''),
-                    address=contrib_data.get('address', ''),
-                    is_in_kind=contrib_data.get('in_kind', False),
-                    is_loan=contrib_data.get('loan', False),
-                    is_amendment=contrib_data.get('amendment', False),
-                    amount=Decimal(str(contrib_data.get('amount', 0)))
-                )
-                contribution.save()
+            # Build and insert one batch at a time so peak memory stays flat on large reports
+            for batch in chunked(contributions):
+                Contribution.objects.bulk_create([
+                    Contribution(
+                        report=report,
+                        date_received_raw=contrib_data.get('date_received', ''),
+                        date_received=self.parse_date(contrib_data.get('date_received', '')),
+                        contributor_name=contrib_data.get('contributor_name', ''),
+                        address=contrib_data.get('address', ''),
+                        **contribution_state_columns(contrib_data.get('address', '')),
+                        is_in_kind=contrib_data.get('in_kind', False),
+                        is_loan=contrib_data.get('loan', False),
+                        is_amendment=contrib_data.get('amendment', False),
+                        amount=Decimal(str(contrib_data.get('amount', 0)))
+                    )
+                    for contrib_data in batch
+                ], batch_size=BATCH_SIZE)
 
             # Import expenditures (expenditures was already extracted above for blank check)
             self.stdout.write(f'Importing {len(expenditures)} expenditures...')
 
-            for exp_data in expenditures:
-                expenditure = Expenditure(
-                    report=report,
-                    date_raw=exp_data.get('date', ''),
-                    date=self.parse_date(exp_data.get('date', '')),
-                    recipient_name=exp_data.get('recipient_name', ''),
-                    address=exp_data.get('address', ''),  # Location/venue for lobbyist expenditures
-                    purpose=exp_data.get('purpose', ''),
-                    is_in_kind=exp_data.get('in_kind', False),
-                    is_loan=exp_data.get('loan', False),
-                    is_amendment=exp_data.get('amendment', False),
-                    amount=Decimal(str(exp_data.get('amount', 0)))
-                )
-                expenditure.save()
+            for batch in chunked(expenditures):
+                Expenditure.objects.bulk_create([
+                    Expenditure(
+                        report=report,
+                        date_raw=exp_data.get('date', ''),
+                        date=self.parse_date(exp_data.get('date', '')),
+                        recipient_name=exp_data.get('recipient_name', ''),
+                        address=exp_data.get('address', ''),  # Location/venue for lobbyist expenditures
+                        purpose=exp_data.get('purpose', ''),
+                        is_in_kind=exp_data.get('in_kind', False),
+                        is_loan=exp_data.get('loan', False),
+                        is_amendment=exp_data.get('amendment', False),
+                        amount=Decimal(str(exp_data.get('amount', 0)))
+                    )
+                    for exp_data in batch
+                ], batch_size=BATCH_SIZE)
 
         # Print summary
         self.stdout.write(self.style.SUCCESS('\n✓ Import completed successfully!'))
@@ -181,9 +194,3 @@ class Command(BaseCommand):
         self.stdout.write(f'  Expenditures: {expenditures.__len__()} (${sum(e.get("amount", 0) for e in expenditures):,.2f})')
         ending_bal = report.ending_balance if report.ending_balance is not None else 0
         self.stdout.write(f'  Ending Balance: ${ending_bal:,.2f}')
-
-    def _get_decimal(self, value):
-        """Convert value to Decimal, handling None."""
-        if value is None or value == '':
-            return None
-        return Decimal(str(value))
@@ -125,8 +125,8 @@ class Command(BaseCommand):
             principals = entity_data.get('principals', [])
             if principals:
                 self.stdout.write(f'Importing {len(principals)} principals...')
-                for idx, principal_data in enumerate(principals):
-                    principal = LobbyistPrincipal(
+                LobbyistPrincipal.objects.bulk_create([
+                    LobbyistPrincipal(
                         lobbyist=entity,
                         name=principal_data.get('name', ''),
                         contact=principal_data.get('contact', ''),
@@ -134,7 +134,8 @@ class Command(BaseCommand):
                         address=principal_data.get('address', ''),
                         order=idx
                     )
-                    principal.save()
+                    for idx, principal_data in enumerate(principals)
+                ])
 
         # Print summary
         self.stdout.write(self.style.SUCCESS('\n✓ Import completed successfully!'))
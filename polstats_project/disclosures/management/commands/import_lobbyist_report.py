@@ -11,6 +11,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../../../'))
 
 from lobbyist_parser import parse_lobbyist_report
 from ...models import LobbyistReport, LobbyistExpenditure
+from ._import_base import BATCH_SIZE, chunked
 
 
 class Command(BaseCommand):
@@ -129,18 +130,20 @@ class Command(BaseCommand):
             expenditures = data.get('expenditures', [])
             self.stdout.write(f'Importing {len(expenditures)} expenditures...')
 
-            for exp_data in expenditures:
-                expenditure = LobbyistExpenditure(
-                    report=report,
-                    date_raw=exp_data.get('date', ''),
-                    date=self.parse_date(exp_data.get('date', '')),
-                    recipient_name=exp_data.get('recipient_name', ''),
-                    location=exp_data.get('location', ''),
-                    purpose=exp_data.get('purpose', ''),
-                    is_amendment=exp_data.get('amendment', False),
-                    amount=Decimal(str(exp_data.get('amount', 0)))
-                )
-                expenditure.save()
+            for batch in chunked(expenditures):
+                LobbyistExpenditure.objects.bulk_create([
+                    LobbyistExpenditure(
+                        report=report,
+                        date_raw=exp_data.get('date', ''),
+                        date=self.parse_date(exp_data.get('date', '')),
+                        recipient_name=exp_data.get('recipient_name', ''),
+                        location=exp_data.get('location', ''),
+                        purpose=exp_data.get('purpose', ''),
+                        is_amendment=exp_data.get('amendment', False),
+                        amount=Decimal(str(exp_data.get('amount', 0)))
+                    )
+                    for exp_data in batch
+                ], batch_size=BATCH_SIZE)
 
         # Print summary
         self.stdout.write(self.style.SUCCESS('\n✓ Import completed successfully!'))
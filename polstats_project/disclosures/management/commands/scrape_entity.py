@@ -2,15 +2,84 @@ import re
 from django.core.management.base import BaseCommand, CommandError
 from django.utils import timezone
 from django.db import transaction
-from datetime import datetime
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+import lxml.html
 import requests
 from decouple import config
 
-from ...models import EntityRegistration, EntityOfficer
+try:
+    from selectolax.lexbor import LexborHTMLParser
+except ImportError:  # optional, only needed for --parser selectolax
+    LexborHTMLParser = None
 
-# Load custom User-Agent from environment
-USER_AGENT = config('USER_AGENT', default='PolStatsBot/1.0 (Utah Political Finance Data Aggregator)')
+from ...models import EntityRegistration, EntityOfficer
+from ._http import SESSION, add_cache_arguments, configure_cache
+from ._import_base import parse_date_str
+
+# Only labels, bold spans and their parent divs are read, so skip building the rest of the DOM
+ENTITY_STRAINER = SoupStrainer(['label', 'span', 'div'])
+
+# HTML backend for entity pages: 'bs4' (default), 'lxml' or 'selectolax'
+ENTITY_PARSER = config('ENTITY_PARSER', default='bs4')
+
+# "UT 84101" / "UT 84101-1234" at the end of an address
+_STATE_ZIP_RE = re.compile(r'([A-Z]{2})\s+(\d{5}(?:-\d{4})?)')
+
+# The common "street, city, ST 12345" / "city, ST 12345" shapes in one match
+_ADDR_RE = re.compile(
+    r'^\s*(?:(?P<street_address>[^,]+),\s*)?(?P<city>[^,]+),\s*'
+    r'(?P<state>[A-Z]{2})\s+(?P<zip_code>\d{5}(?:-\d{4})?)\s*$'
+)
+
+# Runs of whitespace collapsed by clean_text (\s already covers \xa0)
+_WS_RE = re.compile(r'\s+')
+
+# Stray NULs dropped by clean_text; PostgreSQL rejects them in text columns
+_CTRL_TRANS = str.maketrans('', '', '\x00')
+
+# Entity fields keyed by the label's "for" attribute, then by its text
+ENTITY_FOR_MAP = {
+    'Name': 'name',
+    'AlsoKnownAs': 'also_known_as',
+    'DateCreated': 'date_created',
+}
+ENTITY_FIELD_MAP = {
+    'Name': 'name',
+    'Also known as': 'also_known_as',
+    'Date Created': 'date_created',
+    'Type': 'entity_type',
+    'Entity Type': 'entity_type',
+    'Registration Type': 'entity_type',
+    'Status': 'status',
+    'Street Address': 'street_address',
+    'Suite/PO Box': 'suite_po_box',
+    'City': 'city',
+    'State': 'state',
+    'Zip': 'zip_code',
+}
+
+# Officer fields keyed by label text; address labels are parsed separately
+OFFICER_FIELD_MAP = {
+    'First Name': 'first_name',
+    'Middle Name': 'middle_name',
+    'Last Name': 'last_name',
+    'Title': 'title',
+    'Phone': 'phone',
+    'Email': 'email',
+}
+_OFFICER_NAME_PARTS = (
+    ('First', 'first_name'),
+    ('Middle', 'middle_name'),
+    ('Last', 'last_name'),
+)
+
+# Header text marking the treasurer/CFO section
+_TREASURER_KEYS = frozenset({'Chief Financial Officer', 'Treasurer'})
+
+
+def _is_bold(style):
+    """Officer headers are spans styled inline with font-weight: bold."""
+    return style is not None and 'font-weight: bold' in style
 
 
 class Command(BaseCommand):
@@ -27,6 +96,13 @@ class Command(BaseCommand):
             action='store_true',
             help='Update existing entity if it already exists'
         )
+        parser.add_argument(
+            '--parser',
+            choices=['bs4', 'lxml', 'selectolax'],
+            default=ENTITY_PARSER,
+            help='HTML parser backend (default: ENTITY_PARSER setting, or bs4)'
+        )
+        add_cache_arguments(parser)
 
     def parse_date(self, date_str):
         """Parse date string in M/D/YYYY format."""
@@ -34,28 +110,34 @@ class Command(BaseCommand):
             return None
 
         date_str = date_str.strip()
-        try:
-            return datetime.strptime(date_str, '%m/%d/%Y').date()
-        except ValueError:
-            try:
-                return datetime.strptime(date_str, '%Y-%m-%d').date()
-            except ValueError:
-                self.stdout.write(
-                    self.style.WARNING(f'Could not parse date: {date_str}')
-                )
-                return None
+        parsed = parse_date_str(date_str)
+        if parsed is not None:
+            return parsed
+
+        self.stdout.write(
+            self.style.WARNING(f'Could not parse date: {date_str}')
+        )
+        return None
 
     def clean_text(self, text):
         """Clean whitespace from text."""
         if not text:
             return ''
-        return ' '.join(text.strip().split())
+        return _WS_RE.sub(' ', text.translate(_CTRL_TRANS)).strip()
 
     def parse_address(self, address_text):
         """Parse address into components."""
         if not address_text:
             return {}
 
+        match = _ADDR_RE.match(address_text)
+        if match:
+            result = match.groupdict('')
+            result['street_address'] = result['street_address'].strip()
+            result['city'] = result['city'].strip()
+            return result
+
+        # Anything else (extra commas, trailing text, unrecognised state/zip)
         parts = [p.strip() for p in address_text.split(',')]
 
         result = {
@@ -71,34 +153,183 @@ class Command(BaseCommand):
 
             # Parse state and zip from last part
             state_zip = parts[2].strip()
-            match = re.match(r'([A-Z]{2})\s+(\d{5}(?:-\d{4})?)', state_zip)
+            match = _STATE_ZIP_RE.match(state_zip)
             if match:
                 result['state'] = match.group(1)
                 result['zip_code'] = match.group(2)
         elif len(parts) == 2:
             result['city'] = parts[0]
             state_zip = parts[1].strip()
-            match = re.match(r'([A-Z]{2})\s+(\d{5}(?:-\d{4})?)', state_zip)
+            match = _STATE_ZIP_RE.match(state_zip)
             if match:
                 result['state'] = match.group(1)
                 result['zip_code'] = match.group(2)
 
         return result
 
-    def scrape_entity(self, entity_id):
+    def label_value(self, label_text, full_text):
+        """Return a field value: the parent div's cleaned text with the leading label text removed."""
+        if full_text.startswith(label_text):
+            return full_text[len(label_text):].strip()
+        return full_text
+
+    def officer_field(self, label_text):
+        """Return the officer_data key for an officer label, or None."""
+        field = OFFICER_FIELD_MAP.get(label_text)
+        if field:
+            return field
+        # Name labels vary ("First Name", "First"), so fall back to a substring match
+        for key, field in _OFFICER_NAME_PARTS:
+            if key in label_text:
+                return field
+        return None
+
+    def is_officer_header(self, span_text):
+        return (
+            'Name of Primary Officer' in span_text
+            or 'Name of additional' in span_text
+            or 'Name of the PAC Chief Financial Officer' in span_text
+        )
+
+    def walk(self, nodes, tag_of, text_of, attr_of, parent_div_of, key_of):
+        """
+        Collect labels and officer sections in a single document-order pass.
+
+        nodes yields the page's elements in document order; the *_of callables
+        adapt the parser backend. Returns (label_rows, officer_sections):
+        label_rows is a list of (label_text, label_for, field_value) for every
+        label on the page; officer_sections is a list of
+        (header_text, [(label_text, field_value), ...]) for each officer header,
+        with None in place of the labels when the header has no containing div.
+
+        An officer section covers the labels in the 20 divs following the
+        header's div, and ends early at the next bold "Name of ..." span.
+        """
+        label_rows = []
+        # Cleaned text of each label's parent div; sibling labels share a div
+        div_texts = {}
+        officer_sections = []
+
+        officer_labels = None  # labels of the officer section being collected
+        header_key = None
+        divs_left = 0
+
+        for node in nodes:
+            tag = tag_of(node)
+
+            if tag == 'div':
+                if officer_labels is not None:
+                    divs_left -= 1
+                    if divs_left < 0:
+                        officer_labels = None
+
+            elif tag == 'span':
+                if not _is_bold(attr_of(node, 'style')):
+                    continue
+
+                raw_text = text_of(node)
+                # Stop if we hit another officer section
+                if 'Name of' in raw_text:
+                    officer_labels = None
+
+                span_text = self.clean_text(raw_text)
+                if not self.is_officer_header(span_text):
+                    continue
+
+                header_div = parent_div_of(node)
+                if header_div is None:
+                    officer_sections.append((span_text, None))
+                    continue
+
+                officer_labels = []
+                officer_sections.append((span_text, officer_labels))
+                header_key = key_of(header_div)
+                divs_left = 20  # Check next 20 divs
+
+            elif tag == 'label':
+                # The value is in the parent div's text, excluding the label
+                label_parent = parent_div_of(node)
+                if label_parent is None:
+                    continue
+
+                label_text = self.clean_text(text_of(node))
+                parent_key = key_of(label_parent)
+                full_text = div_texts.get(parent_key)
+                if full_text is None:
+                    full_text = div_texts[parent_key] = self.clean_text(text_of(label_parent))
+                field_value = self.label_value(label_text, full_text)
+                label_rows.append((label_text, attr_of(node, 'for'), field_value))
+
+                if officer_labels is not None and parent_key != header_key:
+                    officer_labels.append((label_text, field_value))
+
+        return label_rows, officer_sections
+
+    def walk_bs4(self, content):
+        """Walk the page with BeautifulSoup."""
+        soup = BeautifulSoup(content, 'lxml', parse_only=ENTITY_STRAINER)
+
+        return self.walk(
+            soup.find_all(['div', 'span', 'label']),
+            tag_of=lambda node: node.name,
+            text_of=lambda node: node.get_text(),
+            attr_of=lambda node, name: node.get(name) or '',
+            parent_div_of=lambda node: node.find_parent('div'),
+            key_of=id,
+        )
+
+    def walk_lxml(self, content):
+        """Walk the page with lxml.html directly, without building a BeautifulSoup tree."""
+        root = lxml.html.document_fromstring(content)
+
+        return self.walk(
+            root.iter('div', 'span', 'label'),
+            tag_of=lambda node: node.tag,
+            text_of=lambda node: node.text_content(),
+            attr_of=lambda node, name: node.get(name) or '',
+            parent_div_of=lambda node: next(node.iterancestors('div'), None),
+            # lxml hands back the same proxy while a reference is held, and walk()
+            # holds on to every key it compares, so the element itself is a safe key
+            key_of=lambda node: node,
+        )
+
+    def walk_selectolax(self, content):
+        """Walk the page with selectolax's lexbor backend."""
+        tree = LexborHTMLParser(content)
+
+        def parent_div(node):
+            node = node.parent
+            while node is not None and node.tag != 'div':
+                node = node.parent
+            return node
+
+        return self.walk(
+            tree.root.traverse(),
+            tag_of=lambda node: node.tag,
+            text_of=lambda node: node.text(deep=True),
+            attr_of=lambda node, name: node.attributes.get(name) or '',
+            parent_div_of=parent_div,
+            key_of=lambda node: node.mem_id,
+        )
+
+    def scrape_entity(self, entity_id, parser=ENTITY_PARSER):
         """Scrape entity registration page."""
         url = f'https://disclosures.utah.gov/Registration/EntityDetails/{entity_id}'
 
         self.stdout.write(f'Fetching entity data from: {url}')
 
         try:
-            headers = {'User-Agent': USER_AGENT}
-            response = requests.get(url, headers=headers, timeout=30)
+            response = SESSION.get(url, timeout=30)
             response.raise_for_status()
         except requests.RequestException as e:
             raise CommandError(f'Error fetching entity page: {str(e)}')
 
-        soup = BeautifulSoup(response.content, 'html.parser')
+        if parser == 'selectolax':
+            label_rows, officer_sections = self.walk_selectolax(response.content)
+        elif parser == 'lxml':
+            label_rows, officer_sections = self.walk_lxml(response.content)
+        else:
+            label_rows, officer_sections = self.walk_bs4(response.content)
 
         # Extract entity data
         entity_data = {
@@ -107,138 +338,66 @@ class Command(BaseCommand):
             'raw_data': {}
         }
 
-        # Find all labels and get their values
         # Strategy: use FIRST occurrence of each field (PAC info comes before officer/affiliated org info)
-        all_labels = soup.find_all('label')
-
-        for label in all_labels:
-            label_text = self.clean_text(label.get_text())
-            label_for = label.get('for', '')
-
-            # Find the value - it's in the parent div's text, excluding the label
-            parent_div = label.find_parent('div')
-            if parent_div:
-                # Get all text from parent, then remove label text
-                full_text = self.clean_text(parent_div.get_text())
-                # Remove the label text from the beginning
-                if full_text.startswith(label_text):
-                    field_value = full_text[len(label_text):].strip()
-                else:
-                    field_value = full_text
-
-                # Store in raw_data (only if not already present - first wins)
-                if label_text not in entity_data['raw_data']:
-                    entity_data['raw_data'][label_text] = field_value
-
-                # Map specific fields - use FIRST occurrence only
-                if label_for == 'Name' or (label_text == 'Name' and 'name' not in entity_data):
-                    entity_data['name'] = field_value
-                elif (label_for == 'AlsoKnownAs' or label_text == 'Also known as') and 'also_known_as' not in entity_data:
-                    entity_data['also_known_as'] = field_value
-                elif (label_for == 'DateCreated' or label_text == 'Date Created') and 'date_created' not in entity_data:
-                    entity_data['date_created'] = self.parse_date(field_value)
-                elif (label_text == 'Type' or label_text == 'Entity Type' or label_text == 'Registration Type') and 'entity_type' not in entity_data:
-                    entity_data['entity_type'] = field_value
-                elif (label_text == 'Status') and 'status' not in entity_data:
-                    entity_data['status'] = field_value
-                elif label_text == 'Street Address' and 'street_address' not in entity_data:
-                    entity_data['street_address'] = field_value
-                elif label_text == 'Suite/PO Box' and 'suite_po_box' not in entity_data:
-                    entity_data['suite_po_box'] = field_value
-                elif label_text == 'City' and 'city' not in entity_data:
-                    entity_data['city'] = field_value
-                elif label_text == 'State' and 'state' not in entity_data:
-                    entity_data['state'] = field_value
-                elif label_text == 'Zip' and 'zip_code' not in entity_data:
-                    entity_data['zip_code'] = field_value
-
-        # Extract officers by looking for span tags with bold text
+        for label_text, label_for, field_value in label_rows:
+            # Store in raw_data (only if not already present - first wins)
+            if label_text not in entity_data['raw_data']:
+                entity_data['raw_data'][label_text] = field_value
+
+            # Map specific fields - use FIRST occurrence only, except that the
+            # for="Name" label always wins
+            field = ENTITY_FOR_MAP.get(label_for) or ENTITY_FIELD_MAP.get(label_text)
+            if field and (field not in entity_data or label_for == 'Name'):
+                if field == 'date_created':
+                    field_value = self.parse_date(field_value)
+                entity_data[field] = field_value
+
+        # Extract officers from the sections that follow each bold officer header
         officers = []
-        officer_idx = 0
-
-        all_spans = soup.find_all('span', style=lambda value: value and 'font-weight: bold' in value)
-
-        for span in all_spans:
-            span_text = self.clean_text(span.get_text())
 
-            # Look for officer section headers
-            if 'Name of Primary Officer' in span_text or 'Name of additional' in span_text or 'Name of the PAC Chief Financial Officer' in span_text:
-                officer_data = {
-                    'order': officer_idx,
-                    'is_treasurer': 'Chief Financial Officer' in span_text or 'Treasurer' in span_text
-                }
-                officer_idx += 1
-
-                # Find the div containing this span
-                parent_div = span.find_parent('div')
-                if not parent_div:
-                    continue
-
-                # Look for labels in subsequent divs
-                current_elem = parent_div
-                for _ in range(20):  # Check next 20 elements
-                    next_div = current_elem.find_next('div')
-                    if not next_div:
-                        break
-
-                    # Stop if we hit another officer section
-                    next_span = next_div.find('span', style=lambda value: value and 'font-weight: bold' in value)
-                    if next_span and ('Name of' in next_span.get_text()):
-                        break
-
-                    # Look for labels in this div
-                    labels_in_div = next_div.find_all('label')
-                    for label in labels_in_div:
-                        label_text = self.clean_text(label.get_text())
-                        label_for = label.get('for', '')
-
-                        # Get value from parent div
-                        label_parent = label.find_parent('div')
-                        if label_parent:
-                            full_text = self.clean_text(label_parent.get_text())
-                            if full_text.startswith(label_text):
-                                field_value = full_text[len(label_text):].strip()
-                            else:
-                                field_value = full_text
-
-                            # Map officer fields - collect name parts separately
-                            if 'First' in label_text:
-                                officer_data['first_name'] = field_value
-                            elif 'Middle' in label_text:
-                                officer_data['middle_name'] = field_value
-                            elif 'Last' in label_text:
-                                officer_data['last_name'] = field_value
-                            elif label_text == 'Title':
-                                officer_data['title'] = field_value
-                            elif label_text == 'Phone':
-                                officer_data['phone'] = field_value
-                            elif label_text == 'Email':
-                                officer_data['email'] = field_value
-                            elif 'Address' in label_text:
-                                # Parse address
-                                addr_parts = self.parse_address(field_value)
-                                officer_data.update(addr_parts)
-
-                    current_elem = next_div
-
-                # Assemble full name from parts
-                name_parts = []
-                if 'first_name' in officer_data and officer_data['first_name']:
-                    name_parts.append(officer_data['first_name'])
-                if 'middle_name' in officer_data and officer_data['middle_name']:
-                    name_parts.append(officer_data['middle_name'])
-                if 'last_name' in officer_data and officer_data['last_name']:
-                    name_parts.append(officer_data['last_name'])
-
-                if name_parts:
-                    officer_data['name'] = ' '.join(name_parts)
-                    officers.append(officer_data)
+        for officer_idx, (span_text, officer_labels) in enumerate(officer_sections):
+            officer_data = {
+                'order': officer_idx,
+                'is_treasurer': any(key in span_text for key in _TREASURER_KEYS)
+            }
+
+            # Header without a containing div
+            if officer_labels is None:
+                continue
+
+            for label_text, field_value in officer_labels:
+                # Map officer fields - collect name parts separately
+                field = self.officer_field(label_text)
+                if field:
+                    officer_data[field] = field_value
+                elif 'Address' in label_text:
+                    # Parse address
+                    addr_parts = self.parse_address(field_value)
+                    officer_data.update(addr_parts)
+
+            # Assemble full name from parts
+            name_parts = []
+            if 'first_name' in officer_data and officer_data['first_name']:
+                name_parts.append(officer_data['first_name'])
+            if 'middle_name' in officer_data and officer_data['middle_name']:
+                name_parts.append(officer_data['middle_name'])
+            if 'last_name' in officer_data and officer_data['last_name']:
+                name_parts.append(officer_data['last_name'])
+
+            if name_parts:
+                officer_data['name'] = ' '.join(name_parts)
+                officers.append(officer_data)
 
         return entity_data, officers
 
     def handle(self, *args, **options):
         entity_id = options['entity_id']
         update = options['update']
+        parser = options['parser']
+        configure_cache(options)
+
+        if parser == 'selectolax' and LexborHTMLParser is None:
+            raise CommandError('The selectolax parser requires the selectolax package (pip install selectolax)')
 
         # Check if entity already exists
         existing_entity = EntityRegistration.objects.filter(entity_id=entity_id).first()
@@ -249,7 +408,7 @@ class Command(BaseCommand):
 
         # Scrape entity data
         try:
-            entity_data, officers_data = self.scrape_entity(entity_id)
+            entity_data, officers_data = self.scrape_entity(entity_id, parser)
         except Exception as e:
             raise CommandError(f'Error scraping entity: {str(e)}')
 
@@ -283,8 +442,8 @@ class Command(BaseCommand):
 
             # Import officers
             self.stdout.write(f'Importing {len(officers_data)} officers...')
-            for officer_data in officers_data:
-                officer = EntityOfficer(
+            officers = EntityOfficer.objects.bulk_create([
+                EntityOfficer(
                     entity=entity,
                     name=officer_data.get('name', ''),
                     title=officer_data.get('title', ''),
@@ -299,7 +458,8 @@ class Command(BaseCommand):
                     order=officer_data.get('order', 0),
                     is_treasurer=officer_data.get('is_treasurer', False)
                 )
-                officer.save()
+                for officer_data in officers_data
+            ], batch_size=500)
 
         # Print summary
         self.stdout.write(self.style.SUCCESS('\n✓ Import completed successfully!'))
@@ -308,5 +468,6 @@ class Command(BaseCommand):
         self.stdout.write(f'  Date Created: {entity.date_created}')
         self.stdout.write(f'  Address: {entity.street_address}, {entity.city}, {entity.state} {entity.zip_code}')
         self.stdout.write(f'  Officers: {len(officers_data)}')
-        for officer in entity.officers.all():
+        # Officers were built in 'order' order, matching entity.officers.all()
+        for officer in officers:
             self.stdout.write(f'    - {officer.name} ({officer.title})')
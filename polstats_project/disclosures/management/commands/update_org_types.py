@@ -1,18 +1,30 @@
 """Management command to update organization types for existing reports."""
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from django.core.management.base import BaseCommand
 from django.db import transaction
+from django.db.models import Q
 
 # Add the parent directory to the path to import our parser
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../../../../../'))
 
-from utah_disclosures_parser import parse_utah_disclosure
+from utah_disclosures_parser import parse_report_type_html
 from polstats_project.disclosures.models import DisclosureReport
+from ._http import SESSION, add_cache_arguments, configure_cache
+
+# Rows per bulk_update round-trip
+UPDATE_BATCH_SIZE = 500
+
+# Report ids read from the database per window
+READ_CHUNK_SIZE = 1000
 
 
 class Command(BaseCommand):
-    help = 'Update organization type and title for all existing reports'
+    help = (
+        'Update organization type and title for all existing reports. Only the '
+        'page <title> and <legend> elements are parsed, not the transaction tables.'
+    )
 
     def add_arguments(self, parser):
         parser.add_argument(
@@ -21,48 +33,101 @@ class Command(BaseCommand):
             default=None,
             help='Limit number of reports to update (for testing)'
         )
+        parser.add_argument(
+            '--workers',
+            type=int,
+            default=8,
+            help='Number of reports to fetch concurrently (default: 8)'
+        )
+        add_cache_arguments(parser)
+
+    def fetch_one(self, pk, report_id):
+        """
+        Re-parse one report.
+        Returns: (pk, report_id, organization_type, title, error)
+        """
+        url = f"https://disclosures.utah.gov/Search/PublicSearch/Report/{report_id}"
+        try:
+            response = SESSION.get(url, timeout=30)
+            response.raise_for_status()
+            # A 304 still carries the cached body. Parse it anyway: the report
+            # still has no type, so an earlier run never saved what it parsed.
+            report_info = parse_report_type_html(response.content)
+        except Exception as e:
+            return pk, report_id, None, None, e
+
+        return pk, report_id, report_info.get('organization_type', ''), report_info.get('title', ''), None
+
+    def flush(self, pending):
+        """Write a batch of updated reports in one bulk_update."""
+        if pending:
+            with transaction.atomic():
+                DisclosureReport.objects.bulk_update(
+                    pending, ['organization_type', 'title'], batch_size=UPDATE_BATCH_SIZE
+                )
+            pending.clear()
+
+    def iter_targets(self, reports, total):
+        """
+        Yield (pk, report_id) pairs in windows of READ_CHUNK_SIZE, keyed on pk.
+
+        Each window is a fresh query rather than one long-lived cursor, since
+        the loop writes to the table being read.
+        """
+        last_pk = 0
+        while total > 0:
+            window = list(
+                reports.filter(pk__gt=last_pk).values_list('pk', 'report_id')[:min(READ_CHUNK_SIZE, total)]
+            )
+            if not window:
+                return
+            yield window
+            last_pk = window[-1][0]
+            total -= len(window)
 
     def handle(self, *args, **options):
         limit = options.get('limit')
+        workers = max(1, options['workers'])
+        configure_cache(options)
 
         # Get all reports that don't have an organization type
         reports = DisclosureReport.objects.filter(
-            organization_type__isnull=True
-        ) | DisclosureReport.objects.filter(
-            organization_type=''
-        )
-
-        if limit:
-            reports = reports[:limit]
+            Q(organization_type__isnull=True) | Q(organization_type='')
+        ).order_by('pk')
 
         total = reports.count()
+        if limit:
+            total = min(total, limit)
         self.stdout.write(f'Found {total} reports to update')
 
         updated = 0
         failed = 0
-
-        for report in reports:
-            try:
-                # Re-parse the report to get the organization type
-                url = f"https://disclosures.utah.gov/Search/PublicSearch/Report/{report.report_id}"
-                data = parse_utah_disclosure(url)
-
-                report_info = data.get('report_info', {})
-
-                # Update organization type and title
-                report.organization_type = report_info.get('organization_type', '')
-                report.title = report_info.get('title', '')
-                report.save(update_fields=['organization_type', 'title'])
-
-                updated += 1
-                if updated % 100 == 0:
-                    self.stdout.write(f'Updated {updated}/{total} reports...')
-
-            except Exception as e:
-                failed += 1
-                self.stdout.write(
-                    self.style.ERROR(f'Failed to update report {report.report_id}: {str(e)}')
-                )
+        pending = []
+
+        # Fetching is network-bound, so threads overlap the requests; all
+        # database writes stay on this thread.
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for targets in self.iter_targets(reports, total):
+                results = executor.map(lambda target: self.fetch_one(*target), targets)
+
+                for pk, report_id, organization_type, title, error in results:
+                    if error is not None:
+                        failed += 1
+                        self.stdout.write(
+                            self.style.ERROR(f'Failed to update report {report_id}: {str(error)}')
+                        )
+                        continue
+
+                    # Update organization type and title
+                    pending.append(DisclosureReport(pk=pk, organization_type=organization_type, title=title))
+                    if len(pending) >= UPDATE_BATCH_SIZE:
+                        self.flush(pending)
+
+                    updated += 1
+                    if updated % 100 == 0:
+                        self.stdout.write(f'Updated {updated}/{total} reports...')
+
+        self.flush(pending)
 
         self.stdout.write(self.style.SUCCESS(f'\nCompleted!'))
         self.stdout.write(f'  Updated: {updated}')
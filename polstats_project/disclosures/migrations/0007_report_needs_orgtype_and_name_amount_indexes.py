@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:47
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('disclosures', '0006_expenditure_address'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='contribution',
+            name='disclosures_contrib_0c9f4a_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='expenditure',
+            name='disclosures_recipie_fae952_idx',
+        ),
+        migrations.AddIndex(
+            model_name='contribution',
+            index=models.Index(fields=['contributor_name', 'amount'], name='contrib_name_amt_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='disclosurereport',
+            index=models.Index(condition=models.Q(('organization_type__isnull', True), ('organization_type', ''), _connector='OR'), fields=['id'], name='report_needs_orgtype_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='expenditure',
+            index=models.Index(fields=['recipient_name', 'amount'], name='exp_recip_amt_idx'),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:48
+
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('disclosures', '0007_report_needs_orgtype_and_name_amount_indexes'),
+    ]
+
+    # Each of these duplicated an index that unique=True / db_index=True
+    # already creates on the same column.
+    operations = [
+        migrations.RemoveIndex(
+            model_name='disclosurereport',
+            name='disclosures_report__0d695a_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='disclosurereport',
+            name='disclosures_organiz_f9a30b_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='disclosurereport',
+            name='disclosures_organiz_c5f997_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='entityregistration',
+            name='disclosures_entity__806510_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='entityregistration',
+            name='disclosures_name_0c09dc_idx',
+        ),
+    ]
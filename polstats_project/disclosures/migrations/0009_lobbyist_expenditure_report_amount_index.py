@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:57
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('disclosures', '0008_remove_duplicate_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='lobbyistexpenditure',
+            name='disclosures_amount_4af08a_idx',
+        ),
+        migrations.AddIndex(
+            model_name='lobbyistexpenditure',
+            index=models.Index(fields=['report', '-amount'], name='lobexp_report_amt_idx'),
+        ),
+    ]
@@ -0,0 +1,41 @@
+# GIN indexes for JSON containment lookups on the lobbyist tables.
+#
+# These are PostgreSQL-only (SQLite has no GIN / jsonb), so they are created
+# with raw SQL behind a vendor check instead of being declared in Meta.indexes,
+# which would break migrations on the default SQLite database.
+
+from django.db import migrations
+
+# (index name, table, JSON column)
+GIN_INDEXES = [
+    ('lobrpt_reportinfo_gin', 'disclosures_lobbyistreport', 'report_info'),
+    ('lobreg_rawdata_gin', 'disclosures_lobbyistregistration', 'raw_data'),
+]
+
+
+def create_gin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, table, column in GIN_INDEXES:
+        # jsonb_path_ops only serves @> (__contains) but is much smaller than the default opclass
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table}" USING gin ("{column}" jsonb_path_ops)'
+        )
+
+
+def drop_gin_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, table, column in GIN_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{name}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('disclosures', '0009_lobbyist_expenditure_report_amount_index'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_gin_indexes, drop_gin_indexes),
+    ]
@@ -0,0 +1,69 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:58
+
+from django.db import migrations, models
+
+# The name columns are only ever searched with icontains (admin search), which
+# a B-tree cannot serve. On PostgreSQL they get trigram GIN indexes instead;
+# like 0010 these are raw SQL behind a vendor check so SQLite still migrates.
+
+# (index name, table, column)
+TRGM_INDEXES = [
+    ('lobexp_recipient_trgm', 'disclosures_lobbyistexpenditure', 'recipient_name'),
+    ('lobrpt_principal_trgm', 'disclosures_lobbyistreport', 'principal_name'),
+    ('lobreg_name_trgm', 'disclosures_lobbyistregistration', 'name'),
+]
+
+
+def create_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, table, column in TRGM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table}" USING gin ("{column}" gin_trgm_ops)'
+        )
+
+
+def drop_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, table, column in TRGM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{name}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('disclosures', '0010_lobbyist_json_gin_indexes'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='lobbyistexpenditure',
+            name='disclosures_recipie_8a458e_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='lobbyistregistration',
+            name='disclosures_name_cdfe55_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='lobbyistreport',
+            name='disclosures_princip_3b2692_idx',
+        ),
+        migrations.AlterField(
+            model_name='lobbyistexpenditure',
+            name='recipient_name',
+            field=models.CharField(max_length=500),
+        ),
+        migrations.AlterField(
+            model_name='lobbyistregistration',
+            name='name',
+            field=models.CharField(max_length=500),
+        ),
+        migrations.AlterField(
+            model_name='lobbyistreport',
+            name='principal_name',
+            field=models.CharField(blank=True, max_length=500),
+        ),
+        migrations.RunPython(create_trgm_indexes, drop_trgm_indexes),
+    ]
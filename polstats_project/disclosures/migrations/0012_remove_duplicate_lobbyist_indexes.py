@@ -0,0 +1,33 @@
+# Generated by Django 5.2.18 on 2026-10-15 22:59
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('disclosures', '0011_lobbyist_name_trigram_indexes'),
+    ]
+
+    # unique=True already backs report_id / entity_id with an index; the Meta
+    # entries and db_index=True only duplicated it.
+    operations = [
+        migrations.RemoveIndex(
+            model_name='lobbyistregistration',
+            name='disclosures_entity__202579_idx',
+        ),
+        migrations.RemoveIndex(
+            model_name='lobbyistreport',
+            name='disclosures_report__10a5f6_idx',
+        ),
+        migrations.AlterField(
+            model_name='lobbyistregistration',
+            name='entity_id',
+            field=models.CharField(max_length=50, unique=True),
+        ),
+        migrations.AlterField(
+            model_name='lobbyistreport',
+            name='report_id',
+            field=models.CharField(max_length=50, unique=True),
+        ),
+    ]
@@ -0,0 +1,44 @@
+# Covering indexes for report_detail's per-report SUM(amount) / COUNT(id).
+#
+# Django only emits INCLUDE on PostgreSQL and warns (models.W040) about
+# Index(include=...) on SQLite, so the indexes are created here per vendor:
+# PostgreSQL gets report_id INCLUDE (amount, id); SQLite has no INCLUDE but
+# stores the rowid in every index, so (report_id, amount) covers the same query.
+
+from django.db import migrations
+
+# (index name, table)
+COVERING_INDEXES = [
+    ('contrib_report_cover', 'disclosures_contribution'),
+    ('exp_report_cover', 'disclosures_expenditure'),
+]
+
+
+def create_covering_indexes(apps, schema_editor):
+    vendor = schema_editor.connection.vendor
+    for name, table in COVERING_INDEXES:
+        if vendor == 'postgresql':
+            columns = '("report_id") INCLUDE ("amount", "id")'
+        elif vendor == 'sqlite':
+            columns = '("report_id", "amount")'
+        else:
+            continue
+        schema_editor.execute(f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table}" {columns}')
+
+
+def drop_covering_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor not in ('postgresql', 'sqlite'):
+        return
+    for name, table in COVERING_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{name}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('disclosures', '0012_remove_duplicate_lobbyist_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_covering_indexes, drop_covering_indexes),
+    ]
@@ -0,0 +1,59 @@
+# Generated by Django 5.2.18 on 2026-10-15 23:02
+
+from django.db import migrations, models
+
+# (column, report_info key); mirrors REPORT_INFO_COLUMNS in the import helpers
+COLUMNS = (
+    ('office', 'Office'),
+    ('district', 'District'),
+    ('party', 'Party'),
+    ('county', 'County'),
+)
+
+
+def backfill_office_columns(apps, schema_editor):
+    DisclosureReport = apps.get_model('disclosures', 'DisclosureReport')
+    reports = DisclosureReport.objects.only('id', 'report_info').order_by('pk')
+    pending = []
+    for report in reports.iterator(chunk_size=1000):
+        info = report.report_info or {}
+        for attr, key in COLUMNS:
+            value = info.get(key)
+            setattr(report, attr, None if value is None else str(value))
+        pending.append(report)
+        if len(pending) >= 500:
+            DisclosureReport.objects.bulk_update(pending, [attr for attr, _ in COLUMNS])
+            pending = []
+    if pending:
+        DisclosureReport.objects.bulk_update(pending, [attr for attr, _ in COLUMNS])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('disclosures', '0013_report_amount_covering_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='disclosurereport',
+            name='county',
+            field=models.CharField(blank=True, max_length=200, null=True),
+        ),
+        migrations.AddField(
+            model_name='disclosurereport',
+            name='district',
+            field=models.CharField(blank=True, max_length=200, null=True),
+        ),
+        migrations.AddField(
+            model_name='disclosurereport',
+            name='office',
+            field=models.CharField(blank=True, max_length=200, null=True),
+        ),
+        migrations.AddField(
+            model_name='disclosurereport',
+            name='party',
+            field=models.CharField(blank=True, max_length=200, null=True),
+        ),
+        migrations.RunPython(backfill_office_columns, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,49 @@
+# Trigram GIN indexes for global_search's icontains filters.
+#
+# Each search bucket ORs icontains over several columns; PostgreSQL can only
+# BitmapOr them if every column in the OR is indexed, so all of them are.
+# PostgreSQL-only like 0010/0011 (SQLite keeps its table scans).
+
+from django.db import migrations
+
+# (index name, table, column)
+TRGM_INDEXES = [
+    ('report_id_trgm', 'disclosures_disclosurereport', 'report_id'),
+    ('report_title_trgm', 'disclosures_disclosurereport', 'title'),
+    ('report_orgname_trgm', 'disclosures_disclosurereport', 'organization_name'),
+    ('entity_id_trgm', 'disclosures_entityregistration', 'entity_id'),
+    ('entity_name_trgm', 'disclosures_entityregistration', 'name'),
+    ('entity_aka_trgm', 'disclosures_entityregistration', 'also_known_as'),
+    ('contrib_name_trgm', 'disclosures_contribution', 'contributor_name'),
+    ('contrib_addr_trgm', 'disclosures_contribution', 'address'),
+    ('exp_recipient_trgm', 'disclosures_expenditure', 'recipient_name'),
+    ('exp_purpose_trgm', 'disclosures_expenditure', 'purpose'),
+]
+
+
+def create_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    schema_editor.execute('CREATE EXTENSION IF NOT EXISTS pg_trgm')
+    for name, table, column in TRGM_INDEXES:
+        schema_editor.execute(
+            f'CREATE INDEX IF NOT EXISTS "{name}" ON "{table}" USING gin ("{column}" gin_trgm_ops)'
+        )
+
+
+def drop_trgm_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != 'postgresql':
+        return
+    for name, table, column in TRGM_INDEXES:
+        schema_editor.execute(f'DROP INDEX IF EXISTS "{name}"')
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('disclosures', '0014_report_office_columns'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_trgm_indexes, drop_trgm_indexes),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 23:10
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('disclosures', '0015_search_trigram_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='disclosurereport',
+            index=models.Index(fields=['end_date'], name='report_end_date_idx'),
+        ),
+    ]
@@ -0,0 +1,78 @@
+# Generated by Django 5.2.18 on 2026-10-15 23:11
+
+import re
+
+from django.db import migrations, models
+
+# Frozen copy of the state lookup in disclosures/addresses.py as of this migration
+HOME_STATE = 'UT'
+
+STATES = (
+    'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
+    'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
+    'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
+    'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
+    'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY', 'DC'
+)
+
+STATE_CODES = frozenset(STATES)
+
+ZIP_RE = re.compile(r'\s+\d{5}(?:-\d{4})?$')
+
+STATE_RE = re.compile(r'\b(' + '|'.join(STATES) + r')(?:\s+\d{5}(?:-\d{4})?)?\s*$', re.IGNORECASE)
+
+
+def address_state(address):
+    if not address:
+        return ''
+    tail = address.rstrip()
+    if tail[-1:].isdigit():
+        zip_match = ZIP_RE.search(tail)
+        if zip_match:
+            tail = tail[:zip_match.start()]
+    code = tail[-2:]
+    if len(code) == 2 and code.isascii() and code.upper() in STATE_CODES:
+        start = len(tail) - 2
+        if start == 0 or not (tail[start - 1].isalnum() or tail[start - 1] == '_'):
+            return code.upper()
+    match = STATE_RE.search(address)
+    return match.group(1).upper() if match else ''
+
+
+def backfill_contribution_state(apps, schema_editor):
+    Contribution = apps.get_model('disclosures', 'Contribution')
+    contributions = Contribution.objects.exclude(address='').only('id', 'address').order_by('pk')
+    pending = []
+    for contribution in contributions.iterator(chunk_size=2000):
+        state = address_state(contribution.address)
+        if not state:
+            continue
+        contribution.state = state
+        contribution.is_out_of_state = state != HOME_STATE
+        pending.append(contribution)
+        if len(pending) >= 1000:
+            Contribution.objects.bulk_update(pending, ['state', 'is_out_of_state'])
+            pending = []
+    if pending:
+        Contribution.objects.bulk_update(pending, ['state', 'is_out_of_state'])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('disclosures', '0016_report_end_date_index'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='contribution',
+            name='is_out_of_state',
+            field=models.BooleanField(db_index=True, default=False),
+        ),
+        migrations.AddField(
+            model_name='contribution',
+            name='state',
+            field=models.CharField(blank=True, db_index=True, default='', max_length=2),
+        ),
+        migrations.RunPython(backfill_contribution_state, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 23:15
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('disclosures', '0017_contribution_state'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contribution',
+            index=models.Index(fields=['contributor_name', '-date_received'], name='contrib_name_date_idx'),
+        ),
+    ]
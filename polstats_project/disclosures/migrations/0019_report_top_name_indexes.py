@@ -0,0 +1,21 @@
+# Generated by Django 5.2.18 on 2026-10-15 23:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('disclosures', '0018_contribution_name_date_index'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='contribution',
+            index=models.Index(fields=['report', 'contributor_name', 'amount'], name='contrib_rpt_name_amt_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='expenditure',
+            index=models.Index(fields=['report', 'recipient_name', 'amount'], name='exp_rpt_recip_amt_idx'),
+        ),
+    ]
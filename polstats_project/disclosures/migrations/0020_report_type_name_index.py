@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-15 23:28
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('disclosures', '0019_report_top_name_indexes'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='disclosurereport',
+            name='organization_type',
+            field=models.CharField(blank=True, max_length=100),
+        ),
+        migrations.AddIndex(
+            model_name='disclosurereport',
+            index=models.Index(fields=['organization_type', 'organization_name'], name='report_type_name_idx'),
+        ),
+    ]
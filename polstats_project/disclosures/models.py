@@ -1,5 +1,9 @@
 from django.db import models
+from django.db.models import Q
 from django.utils import timezone
+from django.utils.functional import cached_property
+
+from .addresses import contribution_state_columns
 
 
 class DisclosureReport(models.Model):
@@ -11,9 +15,16 @@ class DisclosureReport(models.Model):
 
     # Organization information
     organization_name = models.CharField(max_length=500, blank=True, db_index=True)
-    organization_type = models.CharField(max_length=100, blank=True, db_index=True)
+    organization_type = models.CharField(max_length=100, blank=True)
     # Types: Political Party, Political Action Committee, Candidate, etc.
 
+    # Candidate office details copied out of report_info so candidate pages read
+    # columns instead of extracting JSON per row. None when the key was absent.
+    office = models.CharField(max_length=200, null=True, blank=True)
+    district = models.CharField(max_length=200, null=True, blank=True)
+    party = models.CharField(max_length=200, null=True, blank=True)
+    county = models.CharField(max_length=200, null=True, blank=True)
+
     # Report period information
     report_type = models.CharField(max_length=200, blank=True)
     begin_date = models.DateField(null=True, blank=True)
@@ -38,10 +49,20 @@ class DisclosureReport(models.Model):
     class Meta:
         ordering = ['-created_at']
         indexes = [
+            # report_id and organization_name are already indexed through
+            # unique/db_index on the fields themselves
             models.Index(fields=['-created_at']),
-            models.Index(fields=['report_id']),
-            models.Index(fields=['organization_type']),
-            models.Index(fields=['organization_name']),
+            # ?year= filters (end_date__year becomes a BETWEEN range) and the year list
+            models.Index(fields=['end_date'], name='report_end_date_idx'),
+            # candidates_list / candidate_detail: exact organization_type, grouped or
+            # filtered by organization_name; also serves organization_type on its own
+            models.Index(fields=['organization_type', 'organization_name'], name='report_type_name_idx'),
+            # Small partial index for update_org_types' "missing type" scan
+            models.Index(
+                fields=['id'],
+                name='report_needs_orgtype_idx',
+                condition=Q(organization_type__isnull=True) | Q(organization_type=''),
+            ),
         ]
 
     def __str__(self):
@@ -63,6 +84,10 @@ class Contribution(models.Model):
     contributor_name = models.CharField(max_length=500)
     address = models.TextField(blank=True)
 
+    # Parsed from address on save / import (see addresses.contribution_state_columns)
+    state = models.CharField(max_length=2, blank=True, default='', db_index=True)
+    is_out_of_state = models.BooleanField(default=False, db_index=True)
+
     # Flags
     is_in_kind = models.BooleanField(default=False)
     is_loan = models.BooleanField(default=False)
@@ -78,12 +103,29 @@ class Contribution(models.Model):
         ordering = ['-date_received', '-created_at']
         indexes = [
             models.Index(fields=['report', '-date_received']),
-            models.Index(fields=['contributor_name']),
+            # Also serves SUM(amount) GROUP BY contributor_name from the index alone
+            models.Index(fields=['contributor_name', 'amount'], name='contrib_name_amt_idx'),
+            # contributor_detail / api_contributor_timeline: one name, newest first
+            models.Index(fields=['contributor_name', '-date_received'], name='contrib_name_date_idx'),
+            # Per-report top contributors: SUM(amount) GROUP BY contributor_name for one report
+            models.Index(fields=['report', 'contributor_name', 'amount'], name='contrib_rpt_name_amt_idx'),
             models.Index(fields=['-amount']),
         ]
 
+    @cached_property
+    def amount_display(self):
+        """Amount as shown in __str__ (e.g. "$500.00"), formatted once per instance."""
+        return f"${self.amount}"
+
+    def save(self, *args, **kwargs):
+        # Keep the parsed state in step with the address. bulk_create skips
+        # save(), so the import commands fill these columns themselves.
+        for field, value in contribution_state_columns(self.address).items():
+            setattr(self, field, value)
+        super().save(*args, **kwargs)
+
     def __str__(self):
-        return f"{self.contributor_name} - ${self.amount} on {self.date_received}"
+        return f"{self.contributor_name} - {self.amount_display} on {self.date_received}"
 
 
 class Expenditure(models.Model):
@@ -117,12 +159,20 @@ class Expenditure(models.Model):
         ordering = ['-date', '-created_at']
         indexes = [
             models.Index(fields=['report', '-date']),
-            models.Index(fields=['recipient_name']),
+            # Also serves SUM(amount) GROUP BY recipient_name from the index alone
+            models.Index(fields=['recipient_name', 'amount'], name='exp_recip_amt_idx'),
+            # Per-report top recipients: SUM(amount) GROUP BY recipient_name for one report
+            models.Index(fields=['report', 'recipient_name', 'amount'], name='exp_rpt_recip_amt_idx'),
             models.Index(fields=['-amount']),
         ]
 
+    @cached_property
+    def amount_display(self):
+        """Amount as shown in __str__ (e.g. "$500.00"), formatted once per instance."""
+        return f"${self.amount}"
+
     def __str__(self):
-        return f"{self.recipient_name} - ${self.amount} on {self.date}"
+        return f"{self.recipient_name} - {self.amount_display} on {self.date}"
 
 
 class EntityRegistration(models.Model):
@@ -155,10 +205,7 @@ class EntityRegistration(models.Model):
 
     class Meta:
         ordering = ['-created_at']
-        indexes = [
-            models.Index(fields=['entity_id']),
-            models.Index(fields=['name']),
-        ]
+        # entity_id (unique) and name (db_index) need no extra Meta indexes
 
     def __str__(self):
         return f"{self.name} (ID: {self.entity_id})"
@@ -212,12 +259,12 @@ class EntityOfficer(models.Model):
 class LobbyistReport(models.Model):
     """Lobbyist expenditure report record."""
 
-    report_id = models.CharField(max_length=50, unique=True, db_index=True)
+    report_id = models.CharField(max_length=50, unique=True)
     source_url = models.URLField(max_length=500)
     title = models.CharField(max_length=500, blank=True)
 
     # Principal/Organization information
-    principal_name = models.CharField(max_length=500, blank=True, db_index=True)
+    principal_name = models.CharField(max_length=500, blank=True)
     principal_phone = models.CharField(max_length=50, blank=True)
     principal_street_address = models.CharField(max_length=500, blank=True)
     principal_city = models.CharField(max_length=200, blank=True)
@@ -246,12 +293,24 @@ class LobbyistReport(models.Model):
         ordering = ['-created_at']
         indexes = [
             models.Index(fields=['-created_at']),
-            models.Index(fields=['report_id']),
-            models.Index(fields=['principal_name']),
         ]
 
+    @cached_property
+    def total_expenditures_display(self):
+        """Total expenditures as "$1,234.56" (None when unknown), formatted once per instance."""
+        if self.total_expenditures is None:
+            return None
+        if self.total_expenditures < 0:
+            return f"-${-self.total_expenditures:,.2f}"
+        return f"${self.total_expenditures:,.2f}"
+
+    @cached_property
+    def display_name(self):
+        """Principal name, falling back to the report title."""
+        return self.principal_name or self.title
+
     def __str__(self):
-        return f"Lobbyist Report {self.report_id} - {self.principal_name or self.title}"
+        return f"Lobbyist Report {self.report_id} - {self.display_name}"
 
 
 class LobbyistExpenditure(models.Model):
@@ -266,7 +325,7 @@ class LobbyistExpenditure(models.Model):
     date = models.DateField(null=True, blank=True)
     date_raw = models.CharField(max_length=50, blank=True)
 
-    recipient_name = models.CharField(max_length=500, db_index=True)
+    recipient_name = models.CharField(max_length=500)
     location = models.CharField(max_length=500, blank=True)
     purpose = models.TextField(blank=True)
 
@@ -283,24 +342,29 @@ class LobbyistExpenditure(models.Model):
         ordering = ['-date', '-created_at']
         indexes = [
             models.Index(fields=['report', '-date']),
-            models.Index(fields=['recipient_name']),
-            models.Index(fields=['-amount']),
+            # Per-report listings sorted by amount; nothing ranks across all reports
+            models.Index(fields=['report', '-amount'], name='lobexp_report_amt_idx'),
         ]
 
+    @cached_property
+    def amount_display(self):
+        """Amount as shown in __str__ (e.g. "$500.00"), formatted once per instance."""
+        return f"${self.amount}"
+
     def __str__(self):
-        return f"{self.recipient_name} - ${self.amount} on {self.date}"
+        return f"{self.recipient_name} - {self.amount_display} on {self.date}"
 
 
 class LobbyistRegistration(models.Model):
     """Lobbyist entity registration information."""
 
-    entity_id = models.CharField(max_length=50, unique=True, db_index=True)
+    entity_id = models.CharField(max_length=50, unique=True)
     source_url = models.URLField(max_length=500)
 
     # Lobbyist personal information
     first_name = models.CharField(max_length=200, blank=True)
     last_name = models.CharField(max_length=200, blank=True)
-    name = models.CharField(max_length=500, db_index=True)
+    name = models.CharField(max_length=500)
     phone = models.CharField(max_length=50, blank=True)
     registration_date = models.DateField(null=True, blank=True)
 
@@ -329,8 +393,6 @@ class LobbyistRegistration(models.Model):
     class Meta:
         ordering = ['-created_at']
         indexes = [
-            models.Index(fields=['entity_id']),
-            models.Index(fields=['name']),
             models.Index(fields=['organization_name']),
         ]
 
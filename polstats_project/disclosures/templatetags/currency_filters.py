@@ -1,55 +1,87 @@
 """Custom template filters for currency formatting."""
+import re
 from django import template
 from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+
+from ..addresses import find_state
 
 register = template.Library()
 
+# Output for missing / zero amounts
+_ZERO_FMT = '$0.00'
+_ZERO_FMT_INT = '$0'
+
+# Leading/trailing non-letters around a city name
+_CITY_CLEAN_RE = re.compile(r'^[^a-zA-Z]+|[^a-zA-Z]+$')
+
+
+def _dollars(number):
+    """Prefix a formatted number with $, keeping any minus sign in front: -1,234.56 -> -$1,234.56"""
+    if number[0] != '-':
+        return f"${number}"
+    # Amounts that round to zero (-0.00) lose the sign
+    if not number.strip('-0.'):
+        return f"${number[1:]}"
+    return f"-${number[1:]}"
+
+
+@lru_cache(maxsize=2048)
+def _fmt_currency(key):
+    """Format a canonical string amount as $1,234.56 (cached: the same amounts repeat across rows)."""
+    try:
+        # Decimal keeps cents exact; the format spec adds commas and 2 decimal places
+        return _dollars(f"{Decimal(key):,.2f}")
+    except (ValueError, TypeError, InvalidOperation):
+        return _ZERO_FMT
+
+
+@lru_cache(maxsize=2048)
+def _fmt_currency_int(key):
+    """Format a canonical string amount as $1,235 (cached like _fmt_currency)."""
+    try:
+        # Round and format with commas, no decimal places
+        return _dollars(f"{Decimal(key):,.0f}")
+    except (ValueError, TypeError, InvalidOperation):
+        return _ZERO_FMT_INT
+
 
 @register.filter
 def currency(value):
     """
     Format a number as currency with commas and 2 decimal places.
-    Example: 1234.56 -> $1,234.56
+    Example: 1234.56 -> $1,234.56, -1234.56 -> -$1,234.56
     """
     if value is None:
-        return '$0.00'
+        return _ZERO_FMT
+    # Model amounts are already Decimal: format directly, no parsing needed
+    if isinstance(value, Decimal):
+        return _dollars(f"{value:,.2f}")
+    if value == 0:
+        return _ZERO_FMT
 
-    try:
-        # Convert to Decimal for precise handling
-        if isinstance(value, str):
-            value = Decimal(value)
-        elif not isinstance(value, Decimal):
-            value = Decimal(str(value))
-
-        # Format with commas and 2 decimal places
-        return '${:,.2f}'.format(value)
-    except (ValueError, TypeError, InvalidOperation):
-        return '$0.00'
+    # str() gives floats their short repr
+    return _fmt_currency(value if isinstance(value, str) else str(value))
 
 
 @register.filter
 def currency_int(value):
     """
     Format a number as currency with commas, no decimal places.
-    Example: 1234.56 -> $1,235
+    Example: 1234.56 -> $1,235, -1234.56 -> -$1,235
     """
     if value is None:
-        return '$0'
+        return _ZERO_FMT_INT
+    if isinstance(value, Decimal):
+        return _dollars(f"{value:,.0f}")
+    if value == 0:
+        return _ZERO_FMT_INT
 
-    try:
-        # Convert to Decimal for precise handling
-        if isinstance(value, str):
-            value = Decimal(value)
-        elif not isinstance(value, Decimal):
-            value = Decimal(str(value))
-
-        # Round and format with commas, no decimal places
-        return '${:,.0f}'.format(value)
-    except (ValueError, TypeError, InvalidOperation):
-        return '$0'
+    return _fmt_currency_int(value if isinstance(value, str) else str(value))
 
 
 @register.filter
+@lru_cache(maxsize=4096)
 def city_state(address):
     """
     Extract city and state from a full address, censoring street address.
@@ -58,55 +90,35 @@ def city_state(address):
     if not address:
         return 'N/A'
 
-    import re
-
-    # US state abbreviations
-    states = [
-        'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
-        'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
-        'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
-        'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
-        'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY', 'DC'
-    ]
-
     # Try to find a state abbreviation in the address
-    # Pattern: looks for state code optionally followed by zip code
-    state_pattern = r'\b(' + '|'.join(states) + r')(?:\s+\d{5}(?:-\d{4})?)?\s*$'
-    match = re.search(state_pattern, address, re.IGNORECASE)
+    found = find_state(address)
 
-    if not match:
+    if not found:
         # No recognizable state found, return as-is or N/A
         return 'N/A'
 
-    state = match.group(1).upper()
+    state, start = found
 
     # Get everything before the state match
-    before_state = address[:match.start()].strip()
+    before_state = address[:start].strip()
 
-    # Split by comma to find city
-    parts = [p.strip() for p in before_state.split(',')]
+    # The last comma-separated part before the state is likely the city
+    _, sep, city = before_state.rpartition(',')
 
-    if len(parts) >= 2:
-        # Last part before state is likely the city
-        city = parts[-1]
-    elif len(parts) == 1:
+    if not sep:
         # Only one part - could be "Street Address City" format
         # Try to extract just the city by removing typical street patterns
         # Look for patterns like "123 Street Name" and remove them
-        words = parts[0].split()
+        words = before_state.split()
 
         # If it starts with a number or contains common street indicators,
         # try to find where the city name likely starts
         # This is a simple heuristic: take last 2-3 words as city name
         if len(words) > 3:
             city = ' '.join(words[-2:])  # Take last 2 words as city
-        else:
-            city = parts[0]
-    else:
-        city = 'Unknown'
 
-    # Clean up city name - remove trailing/leading special chars
-    city = re.sub(r'^[^a-zA-Z]+|[^a-zA-Z]+$', '', city).strip()
+    # Clean up city name - remove trailing/leading special chars (and whitespace)
+    city = _CITY_CLEAN_RE.sub('', city).strip()
 
     if not city:
         return f"{state}"
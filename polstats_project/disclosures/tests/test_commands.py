@@ -1,18 +1,26 @@
 """Tests for management commands."""
+import json
+import os
+import tempfile
+import time
 from decimal import Decimal
-from django.test import TestCase
+import requests
+from django.test import SimpleTestCase, TestCase
 from django.core.management import call_command
+from unittest import skipIf
 from unittest.mock import patch, MagicMock
 from io import StringIO
 from datetime import date
 
+from ..management.commands._http import SESSION, CachedSession, configure_cache
+from ..management.commands.scrape_entity import LexborHTMLParser
 from ..models import DisclosureReport, EntityRegistration, EntityOfficer
 
 
 class ScrapeEntityCommandTest(TestCase):
     """Test scrape_entity management command."""
 
-    @patch('polstats_project.disclosures.management.commands.scrape_entity.requests.get')
+    @patch('polstats_project.disclosures.management.commands.scrape_entity.SESSION.get')
     def test_scrape_entity_command(self, mock_get):
         """Test that scrape_entity command works."""
         # Mock HTML response
@@ -49,7 +57,7 @@ class ScrapeEntityCommandTest(TestCase):
         self.assertEqual(entity.city, 'Salt Lake City')
         self.assertEqual(entity.state, 'UT')
 
-    @patch('polstats_project.disclosures.management.commands.scrape_entity.requests.get')
+    @patch('polstats_project.disclosures.management.commands.scrape_entity.SESSION.get')
     def test_scrape_entity_update_existing(self, mock_get):
         """Test updating existing entity."""
         # Create existing entity
@@ -84,6 +92,281 @@ class ScrapeEntityCommandTest(TestCase):
         self.assertEqual(entity.city, 'New City')
 
 
+# Entity page with field labels and bold-span officer sections, in the site's layout
+ENTITY_PAGE = b'''
+<html>
+    <body>
+        <label>Orphan</label>
+        <div><label for="Name">Name</label>Utah Families&nbsp;PAC</div>
+        <div><label for="AlsoKnownAs">Also known as</label>UFP</div>
+        <div><label for="DateCreated">Date Created</label>03/15/2019</div>
+        <div><label>Status</label> Active </div>
+        <div><label>Street Address</label>1 Main St</div>
+        <div><label>City</label>Salt Lake City</div>
+        <div><label>State</label>UT</div>
+        <div><label>Zip</label>84101</div>
+        <div><span>Name of the plain span</span></div>
+        <div><span style="font-weight: bold">Officers</span></div>
+        <div>
+            <span style="font-weight: bold">Name of Primary Officer</span>
+            <label>Ignored</label>
+        </div>
+        <div><label>First Name</label>Jane</div>
+        <div><label>Last Name</label>Doe</div>
+        <div><label>Title</label>Chair</div>
+        <div><label>Address</label>12 Elm St, Provo, UT 84601</div>
+        <div><span style="font-weight: bold;">Name of the PAC Chief Financial Officer</span></div>
+        <div><label>First</label>Bob</div>
+        <div><label>Middle</label>Q</div>
+        <div><label>Last</label>Smith</div>
+        <div><label>Phone</label>801-555-0100</div>
+        <div><label>Email</label>bob@example.com</div>
+        <div><label>Address</label>Ogden, UT 84401-1234</div>
+        <div><span style="font-weight: bold">Name of additional Officer</span></div>
+        <div><label>First Name</label>Ann</div>
+        <div><label>Name</label>Not the entity</div>
+        <div><label>Address</label>PO Box 9, Logan, Utah</div>
+    </body>
+</html>
+'''
+
+
+class ScrapeEntityParserParityTest(TestCase):
+    """Test that every scrape_entity parser backend produces the same rows."""
+
+    def scrape(self, parser):
+        """Scrape ENTITY_PAGE with one backend and return its entity and officer rows."""
+        response = MagicMock()
+        response.status_code = 200
+        response.content = ENTITY_PAGE
+        with patch('polstats_project.disclosures.management.commands.scrape_entity.SESSION.get',
+                   return_value=response):
+            call_command('scrape_entity', '850', '--parser', parser, stdout=StringIO())
+
+        entity = EntityRegistration.objects.values(
+            'name', 'also_known_as', 'entity_type', 'date_created', 'status', 'street_address',
+            'suite_po_box', 'city', 'state', 'zip_code', 'raw_data',
+        ).get(entity_id='850')
+        officers = list(EntityOfficer.objects.filter(entity__entity_id='850').order_by('order').values(
+            'name', 'title', 'occupation', 'phone', 'email', 'street_address', 'suite_po_box',
+            'city', 'state', 'zip_code', 'order', 'is_treasurer',
+        ))
+        EntityRegistration.objects.filter(entity_id='850').delete()
+        return entity, officers
+
+    def test_bs4_rows(self):
+        """Test the rows written by the default bs4 backend."""
+        entity, officers = self.scrape('bs4')
+
+        self.assertEqual(entity['name'], 'Utah Families PAC')
+        self.assertEqual(entity['date_created'], date(2019, 3, 15))
+        self.assertEqual(entity['zip_code'], '84101')
+        self.assertEqual(entity['raw_data']['Status'], 'Active')
+        self.assertEqual(
+            [(o['name'], o['title'], o['city'], o['zip_code'], o['is_treasurer']) for o in officers],
+            [
+                ('Jane Doe', 'Chair', 'Provo', '84601', False),
+                ('Bob Q Smith', '', 'Ogden', '84401-1234', True),
+                ('Ann', '', 'Logan', '', False),
+            ],
+        )
+
+    def test_lxml_matches_bs4(self):
+        """Test that the lxml backend writes the same rows as bs4."""
+        self.assertEqual(self.scrape('lxml'), self.scrape('bs4'))
+
+    @skipIf(LexborHTMLParser is None, 'selectolax is not installed')
+    def test_selectolax_matches_bs4(self):
+        """Test that the selectolax backend writes the same rows as bs4."""
+        self.assertEqual(self.scrape('selectolax'), self.scrape('bs4'))
+
+
+def http_response(status_code, content=b'', headers=None):
+    """Build a requests.Response as the network would return it."""
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = content
+    response.headers.update(headers or {})
+    return response
+
+
+@patch('requests.Session.get')
+class CachedSessionTest(SimpleTestCase):
+    """Test the on-disk cache in CachedSession.get."""
+
+    url = 'https://disclosures.utah.gov/Registration/EntityDetails/850'
+
+    def setUp(self):
+        cache_dir = tempfile.TemporaryDirectory()
+        self.addCleanup(cache_dir.cleanup)
+        self.session = CachedSession(cache_dir=cache_dir.name, max_age=60)
+
+    def expire(self):
+        """Age the cached body past max_age."""
+        stale = time.time() - 120
+        os.utime(self.session.cache_path(self.url), (stale, stale))
+
+    def test_fresh_hit_skips_network(self, mock_get):
+        """Test that a fresh cached body is returned without a request."""
+        mock_get.return_value = http_response(200, b'<html>page</html>')
+
+        first = self.session.get(self.url, timeout=30)
+        second = self.session.get(self.url, timeout=30)
+
+        self.assertEqual(mock_get.call_count, 1)
+        self.assertFalse(getattr(first, 'from_cache', False))
+        self.assertTrue(second.from_cache)
+        self.assertFalse(second.not_modified)
+        self.assertEqual(second.status_code, 200)
+        self.assertEqual(second.content, b'<html>page</html>')
+
+    def test_no_cache(self, mock_get):
+        """Test that use_cache=False (--no-cache) neither reads nor writes the cache."""
+        mock_get.return_value = http_response(200, b'<html>page</html>')
+        self.session.configure_cache(use_cache=False)
+
+        self.session.get(self.url)
+        self.session.get(self.url)
+
+        self.assertEqual(mock_get.call_count, 2)
+        self.assertFalse(self.session.cache_path(self.url).exists())
+
+    def test_refresh(self, mock_get):
+        """Test that refresh=True (--refresh) re-fetches unconditionally and overwrites the entry."""
+        mock_get.return_value = http_response(200, b'old', {'ETag': '"v1"'})
+        self.session.get(self.url)
+
+        mock_get.return_value = http_response(200, b'new')
+        self.session.configure_cache(refresh=True, max_age=60)
+        response = self.session.get(self.url)
+
+        self.assertEqual(response.content, b'new')
+        self.assertNotIn('headers', mock_get.call_args.kwargs)
+
+        self.session.configure_cache(max_age=60)
+        self.assertEqual(self.session.get(self.url).content, b'new')
+        self.assertEqual(mock_get.call_count, 2)
+
+    def test_stale_entry_stores_validators(self, mock_get):
+        """Test that a stale entry is revalidated with its stored ETag and Last-Modified."""
+        mock_get.return_value = http_response(200, b'v1', {
+            'ETag': '"v1"', 'Last-Modified': 'Mon, 05 Oct 2026 10:00:00 GMT',
+        })
+        self.session.get(self.url)
+        meta = json.loads(self.session.cache_path(self.url).with_suffix('.json').read_text())
+        self.assertEqual(meta, {'etag': '"v1"', 'last_modified': 'Mon, 05 Oct 2026 10:00:00 GMT'})
+
+        self.expire()
+        mock_get.return_value = http_response(200, b'v2', {'ETag': '"v2"'})
+        response = self.session.get(self.url, headers={'Accept': 'text/html'})
+
+        self.assertEqual(mock_get.call_args.kwargs['headers'], {
+            'Accept': 'text/html',
+            'If-None-Match': '"v1"',
+            'If-Modified-Since': 'Mon, 05 Oct 2026 10:00:00 GMT',
+        })
+        self.assertEqual(response.content, b'v2')
+        self.assertEqual(self.session.get(self.url).content, b'v2')
+        meta = json.loads(self.session.cache_path(self.url).with_suffix('.json').read_text())
+        self.assertEqual(meta, {'etag': '"v2"', 'last_modified': None})
+
+    def test_stale_entry_with_headers_none(self, mock_get):
+        """Test revalidation when the caller passes headers=None."""
+        mock_get.return_value = http_response(200, b'v1', {'ETag': '"v1"'})
+        self.session.get(self.url)
+        self.expire()
+
+        self.session.get(self.url, headers=None)
+
+        self.assertEqual(mock_get.call_args.kwargs['headers'], {'If-None-Match': '"v1"'})
+
+    def test_not_modified_returns_cached_body(self, mock_get):
+        """Test that a 304 after a 200 with an ETag returns the cached body."""
+        mock_get.return_value = http_response(200, b'<html>cached</html>', {'ETag': '"abc"'})
+        self.session.get(self.url)
+        self.expire()
+
+        mock_get.return_value = http_response(304)
+        response = self.session.get(self.url, timeout=30)
+
+        self.assertEqual(mock_get.call_args.kwargs['headers'], {'If-None-Match': '"abc"'})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.content, b'<html>cached</html>')
+        self.assertTrue(response.from_cache)
+        self.assertTrue(response.not_modified)
+        # The 304 refreshed the entry, so the next call stays off the network
+        self.session.get(self.url)
+        self.assertEqual(mock_get.call_count, 2)
+
+    def test_configure_cache_options(self, mock_get):
+        """Test that --no-cache / --refresh / --max-age reach the shared SESSION."""
+        with patch.object(SESSION, 'configure_cache') as mock_configure:
+            configure_cache({'no_cache': True, 'refresh': True, 'max_age': 5})
+        mock_configure.assert_called_once_with(use_cache=False, refresh=True, max_age=5)
+
+
+class UpdateOrgTypesCommandTest(TestCase):
+    """Test update_org_types management command."""
+
+    PAC_PAGE = (
+        b"<html><head><title>Lieutenant Governor's Office - Contributions and Expenditures "
+        b"For Political Action Committee</title></head><body><table></table></body></html>"
+    )
+    PARTY_PAGE = b'<html><body><fieldset><legend>Political Party Information</legend></fieldset></body></html>'
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data."""
+        DisclosureReport.objects.create(
+            report_id='100', source_url='https://example.com/100', organization_type='Candidate'
+        )
+        for number in range(1, 8):
+            DisclosureReport.objects.create(
+                report_id=str(number),
+                source_url=f'https://example.com/{number}',
+            )
+
+    def fake_get(self, url, **kwargs):
+        report_id = url.rsplit('/', 1)[-1]
+        if report_id == '2':
+            raise requests.ConnectionError('connection reset')
+        return http_response(200, self.PARTY_PAGE if report_id == '4' else self.PAC_PAGE)
+
+    @patch('polstats_project.disclosures.management.commands.update_org_types.UPDATE_BATCH_SIZE', 2)
+    @patch('polstats_project.disclosures.management.commands.update_org_types.READ_CHUNK_SIZE', 2)
+    @patch('polstats_project.disclosures.management.commands.update_org_types.SESSION.get')
+    def test_update_org_types(self, mock_get):
+        """Test --limit across read windows, a failed fetch, and the written columns."""
+        mock_get.side_effect = self.fake_get
+
+        out = StringIO()
+        call_command('update_org_types', '--limit', '5', '--workers', '3', '--no-cache', stdout=out)
+
+        fetched = sorted(call.args[0].rsplit('/', 1)[-1] for call in mock_get.call_args_list)
+        self.assertEqual(fetched, ['1', '2', '3', '4', '5'])
+        self.assertIn('Found 5 reports to update', out.getvalue())
+        self.assertIn('Failed to update report 2: connection reset', out.getvalue())
+        self.assertIn('Updated: 4', out.getvalue())
+        self.assertIn('Failed: 1', out.getvalue())
+
+        reports = {
+            report_id: (organization_type, title)
+            for report_id, organization_type, title
+            in DisclosureReport.objects.values_list('report_id', 'organization_type', 'title')
+        }
+        pac = ('Political Action Committee', 'Contributions and Expenditures For Political Action Committee')
+        self.assertEqual(reports, {
+            '100': ('Candidate', ''),
+            '1': pac,
+            '2': ('', ''),
+            '3': pac,
+            '4': ('Political Party', ''),
+            '5': pac,
+            '6': ('', ''),
+            '7': ('', ''),
+        })
+
+
 class BulkScrapeCommandTest(TestCase):
     """Test bulk_scrape management command."""
 
@@ -178,7 +461,7 @@ class ImportDisclosureCommandTest(TestCase):
 class CommandErrorHandlingTest(TestCase):
     """Test error handling in management commands."""
 
-    @patch('polstats_project.disclosures.management.commands.scrape_entity.requests.get')
+    @patch('polstats_project.disclosures.management.commands.scrape_entity.SESSION.get')
     def test_scrape_entity_network_error(self, mock_get):
         """Test handling of network errors."""
         mock_get.side_effect = Exception('Network error')
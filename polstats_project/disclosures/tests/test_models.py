@@ -16,9 +16,10 @@ from ..models import (
 class DisclosureReportModelTest(TestCase):
     """Test DisclosureReport model."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data."""
-        self.report = DisclosureReport.objects.create(
+        cls.report = DisclosureReport.objects.create(
             report_id='12345',
             source_url='https://example.com/report/12345',
             organization_name='Test PAC',
@@ -52,17 +53,18 @@ class DisclosureReportModelTest(TestCase):
 class ContributionModelTest(TestCase):
     """Test Contribution model."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data."""
-        self.report = DisclosureReport.objects.create(
+        cls.report = DisclosureReport.objects.create(
             report_id='12345',
             source_url='https://example.com/report/12345',
             organization_name='Test PAC',
             organization_type='Political Action Committee'
         )
 
-        self.contribution = Contribution.objects.create(
-            report=self.report,
+        cls.contribution = Contribution.objects.create(
+            report=cls.report,
             contributor_name='John Doe',
             address='123 Main St, Salt Lake City, UT 84101',
             amount=Decimal('500.00'),
@@ -90,21 +92,37 @@ class ContributionModelTest(TestCase):
         )
         self.assertEqual(contrib.contributor_name, 'Larry H. Miller Rent A/C')
 
+    def test_contribution_state_from_address(self):
+        """Test that save() fills the state columns from the address."""
+        self.assertEqual(self.contribution.state, 'UT')
+        self.assertFalse(self.contribution.is_out_of_state)
+
+        contrib = Contribution.objects.create(
+            report=self.report,
+            contributor_name='Jane Roe',
+            address='1 Market St, San Francisco, CA 94105',
+            amount=Decimal('250.00'),
+        )
+        contrib.refresh_from_db()
+        self.assertEqual(contrib.state, 'CA')
+        self.assertTrue(contrib.is_out_of_state)
+
 
 class ExpenditureModelTest(TestCase):
     """Test Expenditure model."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data."""
-        self.report = DisclosureReport.objects.create(
+        cls.report = DisclosureReport.objects.create(
             report_id='12345',
             source_url='https://example.com/report/12345',
             organization_name='Test PAC',
             organization_type='Political Action Committee'
         )
 
-        self.expenditure = Expenditure.objects.create(
-            report=self.report,
+        cls.expenditure = Expenditure.objects.create(
+            report=cls.report,
             recipient_name='ABC Consulting',
             purpose='Campaign consulting',
             amount=Decimal('2500.00'),
@@ -126,9 +144,10 @@ class ExpenditureModelTest(TestCase):
 class EntityRegistrationModelTest(TestCase):
     """Test EntityRegistration model."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data."""
-        self.entity = EntityRegistration.objects.create(
+        cls.entity = EntityRegistration.objects.create(
             entity_id='850',
             source_url='https://disclosures.utah.gov/Registration/EntityDetails/850',
             name='Utah Association Of Realtors',
@@ -161,16 +180,17 @@ class EntityRegistrationModelTest(TestCase):
 class EntityOfficerModelTest(TestCase):
     """Test EntityOfficer model."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data."""
-        self.entity = EntityRegistration.objects.create(
+        cls.entity = EntityRegistration.objects.create(
             entity_id='850',
             source_url='https://disclosures.utah.gov/Registration/EntityDetails/850',
             name='Test PAC'
         )
 
-        self.officer = EntityOfficer.objects.create(
-            entity=self.entity,
+        cls.officer = EntityOfficer.objects.create(
+            entity=cls.entity,
             name='Lerron Little',
             title='Chair',
             phone='(801) 437-4555',
@@ -200,7 +220,13 @@ class EntityOfficerModelTest(TestCase):
             order=1
         )
 
-        officers = EntityOfficer.objects.filter(entity=self.entity)
+        # __str__ reads entity.name, so join it up front instead of one query per officer
+        with self.assertNumQueries(1):
+            officers = list(EntityOfficer.objects.filter(entity=self.entity).select_related('entity'))
+            self.assertEqual([str(o) for o in officers], [
+                'Lerron Little - Chair (Test PAC)',
+                'Jacob Jaggi - Accountant (Test PAC)',
+            ])
         self.assertEqual(officers[0], self.officer)
         self.assertEqual(officers[1], officer2)
 
@@ -220,16 +246,17 @@ class EntityOfficerModelTest(TestCase):
 class ModelRelationshipsTest(TestCase):
     """Test model relationships."""
 
-    def setUp(self):
+    @classmethod
+    def setUpTestData(cls):
         """Set up test data."""
-        self.report = DisclosureReport.objects.create(
+        cls.report = DisclosureReport.objects.create(
             report_id='12345',
             source_url='https://example.com/report/12345',
             organization_name='Test PAC',
             organization_type='Political Action Committee'
         )
 
-        self.entity = EntityRegistration.objects.create(
+        cls.entity = EntityRegistration.objects.create(
             entity_id='850',
             source_url='https://disclosures.utah.gov/Registration/EntityDetails/850',
             name='Test PAC'
@@ -237,16 +264,10 @@ class ModelRelationshipsTest(TestCase):
 
     def test_report_contributions_relationship(self):
         """Test that contributions are linked to reports."""
-        contrib1 = Contribution.objects.create(
-            report=self.report,
-            contributor_name='Donor 1',
-            amount=Decimal('100.00')
-        )
-        contrib2 = Contribution.objects.create(
-            report=self.report,
-            contributor_name='Donor 2',
-            amount=Decimal('200.00')
-        )
+        contrib1, contrib2 = Contribution.objects.bulk_create([
+            Contribution(report=self.report, contributor_name='Donor 1', amount=Decimal('100.00')),
+            Contribution(report=self.report, contributor_name='Donor 2', amount=Decimal('200.00')),
+        ], batch_size=500)
 
         self.assertEqual(self.report.contributions.count(), 2)
         self.assertIn(contrib1, self.report.contributions.all())
@@ -254,16 +275,10 @@ class ModelRelationshipsTest(TestCase):
 
     def test_report_expenditures_relationship(self):
         """Test that expenditures are linked to reports."""
-        exp1 = Expenditure.objects.create(
-            report=self.report,
-            recipient_name='Vendor 1',
-            amount=Decimal('150.00')
-        )
-        exp2 = Expenditure.objects.create(
-            report=self.report,
-            recipient_name='Vendor 2',
-            amount=Decimal('250.00')
-        )
+        exp1, exp2 = Expenditure.objects.bulk_create([
+            Expenditure(report=self.report, recipient_name='Vendor 1', amount=Decimal('150.00')),
+            Expenditure(report=self.report, recipient_name='Vendor 2', amount=Decimal('250.00')),
+        ], batch_size=500)
 
         self.assertEqual(self.report.expenditures.count(), 2)
         self.assertIn(exp1, self.report.expenditures.all())
@@ -271,18 +286,10 @@ class ModelRelationshipsTest(TestCase):
 
     def test_entity_officers_relationship(self):
         """Test that officers are linked to entities."""
-        officer1 = EntityOfficer.objects.create(
-            entity=self.entity,
-            name='Officer 1',
-            title='Chair',
-            order=0
-        )
-        officer2 = EntityOfficer.objects.create(
-            entity=self.entity,
-            name='Officer 2',
-            title='Vice Chair',
-            order=1
-        )
+        officer1, officer2 = EntityOfficer.objects.bulk_create([
+            EntityOfficer(entity=self.entity, name='Officer 1', title='Chair', order=0),
+            EntityOfficer(entity=self.entity, name='Officer 2', title='Vice Chair', order=1),
+        ], batch_size=500)
 
         self.assertEqual(self.entity.officers.count(), 2)
         self.assertIn(officer1, self.entity.officers.all())
@@ -1,6 +1,9 @@
 """Tests for disclosure views."""
+import re
 from decimal import Decimal
-from django.test import TestCase, Client
+from django.core.cache import cache
+from django.template import Context, Template
+from django.test import TestCase
 from django.urls import reverse
 from datetime import date
 
@@ -17,8 +20,8 @@ class IndexViewTest(TestCase):
     """Test index view."""
 
     def setUp(self):
-        """Set up test client."""
-        self.client = Client()
+        """Start each test with an empty page cache."""
+        cache.clear()
 
     def test_index_view_loads(self):
         """Test that index view loads successfully."""
@@ -26,17 +29,22 @@ class IndexViewTest(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'disclosures/index.html')
 
+    def test_index_view_is_cached(self):
+        """Test that a repeat request is served from the cache."""
+        self.client.get(reverse('disclosures:index'))
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse('disclosures:index'))
+        self.assertEqual(response.status_code, 200)
+
 
 class ReportsListViewTest(TestCase):
     """Test reports list view."""
 
-    def setUp(self):
-        """Set up test data and client."""
-        self.client = Client()
-
-        # Create test reports
-        for i in range(5):
-            DisclosureReport.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data."""
+        DisclosureReport.objects.bulk_create([
+            DisclosureReport(
                 report_id=f'REPORT{i}',
                 source_url=f'https://example.com/report/{i}',
                 organization_name=f'Test PAC {i}',
@@ -44,6 +52,8 @@ class ReportsListViewTest(TestCase):
                 total_contributions=Decimal('1000.00') * (i + 1),
                 total_expenditures=Decimal('500.00') * (i + 1)
             )
+            for i in range(5)
+        ])
 
     def test_reports_list_view_loads(self):
         """Test that reports list view loads successfully."""
@@ -56,15 +66,28 @@ class ReportsListViewTest(TestCase):
         response = self.client.get(reverse('disclosures:reports_list'))
         self.assertEqual(len(response.context['reports']), 5)
 
+    def test_reports_list_later_pages(self):
+        """Test that later pages continue the sort order without repeating reports."""
+        DisclosureReport.objects.bulk_create([
+            DisclosureReport(report_id=f'EXTRA{i:02d}', source_url=f'https://example.com/extra/{i}')
+            for i in range(30)
+        ])
+        url = reverse('disclosures:reports_list')
+        first = self.client.get(url, {'sort': 'report_id'}).context['page_obj']
+        second = self.client.get(url, {'sort': 'report_id', 'page': 2}).context['page_obj']
+
+        report_ids = [r.report_id for r in first] + [r.report_id for r in second]
+        self.assertEqual(len(second), 10)
+        self.assertEqual(report_ids, sorted(DisclosureReport.objects.values_list('report_id', flat=True)))
+
 
 class ReportDetailViewTest(TestCase):
     """Test report detail view."""
 
-    def setUp(self):
-        """Set up test data and client."""
-        self.client = Client()
-
-        self.report = DisclosureReport.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data."""
+        cls.report = DisclosureReport.objects.create(
             report_id='12345',
             source_url='https://example.com/report/12345',
             organization_name='Test PAC',
@@ -75,7 +98,7 @@ class ReportDetailViewTest(TestCase):
 
         # Add contributions
         Contribution.objects.create(
-            report=self.report,
+            report=cls.report,
             contributor_name='John Doe',
             amount=Decimal('500.00'),
             date_received=date(2024, 1, 15)
@@ -83,7 +106,7 @@ class ReportDetailViewTest(TestCase):
 
         # Add expenditures
         Expenditure.objects.create(
-            report=self.report,
+            report=cls.report,
             recipient_name='ABC Consulting',
             amount=Decimal('250.00'),
             date=date(2024, 1, 20)
@@ -91,9 +114,12 @@ class ReportDetailViewTest(TestCase):
 
     def test_report_detail_view_loads(self):
         """Test that report detail view loads successfully."""
-        response = self.client.get(
-            reverse('disclosures:report_detail', args=['12345'])
-        )
+        # Report, both row lists, both aggregates and the two year_filter
+        # context processor queries; nothing per row
+        with self.assertNumQueries(7):
+            response = self.client.get(
+                reverse('disclosures:report_detail', args=['12345'])
+            )
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'disclosures/report_detail.html')
 
@@ -121,14 +147,125 @@ class ReportDetailViewTest(TestCase):
         self.assertEqual(response.status_code, 404)
 
 
-class ContributorDetailViewTest(TestCase):
-    """Test contributor detail view."""
+# The per-row markup report_detail.html rendered before the report_tables tags
+OLD_REPORT_ROWS = """{% load currency_filters %}
+{% for row in rows %}
+<tr>
+    <td class="text-sm">{{ row.date|date:"M d, Y"|default:row.date_raw }}</td>
+    <td class="font-medium">{{ row.name }}</td>
+    <td class="text-sm">{{ row.detail|truncatechars:40 }}</td>
+    <td class="font-mono text-right">{{ row.amount|currency }}</td>
+    <td>
+        <div class="flex gap-1">
+            {% if row.is_in_kind %}
+            <span class="badge badge-sm badge-info">In-Kind</span>
+            {% endif %}
+            {% if row.is_loan %}
+            <span class="badge badge-sm badge-warning">Loan</span>
+            {% endif %}
+            {% if row.is_amendment %}
+            <span class="badge badge-sm badge-secondary">Amendment</span>
+            {% endif %}
+        </div>
+    </td>
+</tr>
+{% endfor %}"""
+
+
+def _collapse_markup(html):
+    """Drop the whitespace between tags, which the row tags never emit."""
+    return re.sub(r'>\s+<', '><', html).strip()
+
+
+class ReportDetailRowsTest(TestCase):
+    """Test the transaction rows rendered by the report_tables tags."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data."""
+        report = DisclosureReport.objects.create(
+            report_id='ROWS1',
+            source_url='https://example.com/report/ROWS1',
+            organization_name='Test PAC',
+            organization_type='Political Action Committee'
+        )
+        Contribution.objects.bulk_create([
+            # Markup in the text, no parsed date, a long address and every badge
+            Contribution(report=report, contributor_name='<script>alert(1)</script> & Sons',
+                         address='1 Main St <b>& "Co"</b>, Salt Lake City, UT 84101',
+                         date_received=None, date_received_raw='Sometime in 2024',
+                         amount=Decimal('1234.50'), is_in_kind=True, is_loan=True, is_amendment=True),
+            Contribution(report=report, contributor_name="O'Brien", address='Short St',
+                         date_received=date(2024, 1, 15), amount=Decimal('-20.00')),
+        ])
+        Expenditure.objects.bulk_create([
+            Expenditure(report=report, recipient_name='Smith & <Wesson>',
+                        purpose='Consulting services for the spring campaign mailers',
+                        date=None, date_raw='01/2024', amount=Decimal('99.99'), is_loan=True),
+            Expenditure(report=report, recipient_name='Print Shop', purpose='Flyers',
+                        date=date(2024, 2, 3), amount=Decimal('10.00'), is_in_kind=True, is_amendment=True),
+        ])
 
     def setUp(self):
-        """Set up test data and client."""
-        self.client = Client()
+        self.response = self.client.get(reverse('disclosures:report_detail', args=['ROWS1']))
+
+    def test_rows_are_escaped(self):
+        """Test that names, addresses and purposes are HTML-escaped."""
+        self.assertNotContains(self.response, '<script>alert(1)')
+        self.assertContains(self.response, '&lt;script&gt;alert(1)&lt;/script&gt; &amp; Sons')
+        self.assertContains(self.response, 'Smith &amp; &lt;Wesson&gt;')
+        self.assertContains(self.response, 'O&#x27;Brien')
+        self.assertNotContains(self.response, '<b>&')
+
+    def test_rows_match_old_template(self):
+        """Test that the tags render the markup the old {% for %} loops did."""
+        old_rows = Template(OLD_REPORT_ROWS)
+        context = self.response.context
+        for tag, rows, fields in (
+            ('contribution_rows', context['contributions'],
+             ('date_received', 'date_received_raw', 'contributor_name', 'address')),
+            ('expenditure_rows', context['expenditures'],
+             ('date', 'date_raw', 'recipient_name', 'purpose')),
+        ):
+            with self.subTest(tag=tag):
+                date_field, raw_field, name_field, detail_field = fields
+                expected = old_rows.render(Context({'rows': [
+                    {
+                        'date': getattr(row, date_field),
+                        'date_raw': getattr(row, raw_field),
+                        'name': getattr(row, name_field),
+                        'detail': getattr(row, detail_field),
+                        'amount': row.amount,
+                        'is_in_kind': row.is_in_kind,
+                        'is_loan': row.is_loan,
+                        'is_amendment': row.is_amendment,
+                    }
+                    for row in rows
+                ]}))
+                rendered = Template(
+                    '{% load report_tables %}{% ' + tag + ' rows %}'
+                ).render(Context({'rows': rows}))
+                self.assertEqual(_collapse_markup(rendered), _collapse_markup(expected))
+
+    def test_rows_content(self):
+        """Test the raw date fallback, truncation and badges."""
+        self.assertContains(self.response, '<td class="text-sm">Sometime in 2024</td>')
+        self.assertContains(self.response, '<td class="text-sm">01/2024</td>')
+        self.assertContains(self.response, '<td class="text-sm">Jan 15, 2024</td>')
+        self.assertContains(self.response, 'Consulting services for the spring camp…')
+        self.assertNotContains(self.response, 'spring campaign mailers')
+        self.assertContains(self.response, 'badge-info">In-Kind', count=2)
+        self.assertContains(self.response, 'badge-warning">Loan', count=2)
+        self.assertContains(self.response, 'badge-secondary">Amendment', count=2)
+
+
+class ContributorDetailViewTest(TestCase):
+    """Test contributor detail view."""
 
-        self.report = DisclosureReport.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data."""
+        cls.report = DisclosureReport.objects.create(
             report_id='12345',
             source_url='https://example.com/report/12345',
             organization_name='Test PAC',
@@ -137,13 +274,13 @@ class ContributorDetailViewTest(TestCase):
 
         # Add contributions from same contributor
         Contribution.objects.create(
-            report=self.report,
+            report=cls.report,
             contributor_name='John Doe',
             amount=Decimal('500.00'),
             date_received=date(2024, 1, 15)
         )
         Contribution.objects.create(
-            report=self.report,
+            report=cls.report,
             contributor_name='John Doe',
             amount=Decimal('300.00'),
             date_received=date(2024, 2, 15)
@@ -151,11 +288,33 @@ class ContributorDetailViewTest(TestCase):
 
     def test_contributor_detail_view_loads(self):
         """Test that contributor detail view loads successfully."""
+        # No separate exists()/count()/address round trips; the display rows
+        # double as the existence check
+        with self.assertNumQueries(6):
+            response = self.client.get(
+                reverse('disclosures:contributor_detail', args=['John Doe'])
+            )
+        self.assertEqual(response.status_code, 200)
+        self.assertTemplateUsed(response, 'disclosures/contributor_detail.html')
+
+    def test_contributor_stats(self):
+        """Test that the summary stats are aggregated, with a fractional average."""
+        Contribution.objects.create(
+            report=self.report,
+            contributor_name='John Doe',
+            amount=Decimal('101.00'),
+            date_received=date(2024, 3, 15)
+        )
+
         response = self.client.get(
             reverse('disclosures:contributor_detail', args=['John Doe'])
         )
-        self.assertEqual(response.status_code, 200)
-        self.assertTemplateUsed(response, 'disclosures/contributor_detail.html')
+        stats = response.context['stats']
+        self.assertEqual(stats['total_amount'], Decimal('901.00'))
+        self.assertEqual(stats['contribution_count'], 3)
+        self.assertEqual(round(stats['avg_amount'], 2), Decimal('300.33'))
+        self.assertEqual(stats['first_contribution'], date(2024, 1, 15))
+        self.assertEqual(stats['last_contribution'], date(2024, 3, 15))
 
     def test_contributor_with_slash_in_name(self):
         """Test contributor with forward slash in name."""
@@ -173,16 +332,137 @@ class ContributorDetailViewTest(TestCase):
         self.assertContains(response, 'Larry H. Miller Rent A/C')
 
 
-class PACDetailViewTest(TestCase):
-    """Test PAC detail view."""
+class ContributorsListViewTest(TestCase):
+    """Test contributors list view."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data."""
+        report = DisclosureReport.objects.create(
+            report_id='12345',
+            source_url='https://example.com/report/12345',
+            organization_name='Test PAC',
+            organization_type='Political Action Committee'
+        )
+        Contribution.objects.bulk_create([
+            Contribution(report=report, contributor_name=f'Contributor {i}', amount=Decimal('100.00'))
+            for i in range(60)
+        ])
 
     def setUp(self):
-        """Set up test data and client."""
-        self.client = Client()
+        """Start each test with an empty cache."""
+        cache.clear()
+
+    def test_contributors_list_count_is_cached(self):
+        """Test that the grouped count is computed once across pages."""
+        url = reverse('disclosures:contributors_list')
+        # Count, page rows and the two year_filter context processor queries
+        with self.assertNumQueries(4):
+            response = self.client.get(url)
+        self.assertEqual(response.context['page_obj'].paginator.count, 60)
+        with self.assertNumQueries(3):
+            response = self.client.get(url, {'page': 2})
+        self.assertEqual(len(response.context['page_obj']), 10)
+
+
+class TimelineAPITest(TestCase):
+    """Test the timeline API endpoints."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data."""
+        cls.report = DisclosureReport.objects.create(
+            report_id='12345',
+            source_url='https://example.com/report/12345',
+            organization_name='Test PAC',
+            organization_type='Political Action Committee'
+        )
+        Contribution.objects.bulk_create([
+            Contribution(report=cls.report, contributor_name='John Doe',
+                         amount=Decimal('500.00'), date_received=date(2024, 1, 15)),
+            Contribution(report=cls.report, contributor_name='John Doe',
+                         amount=Decimal('300.00'), date_received=date(2024, 1, 20)),
+            Contribution(report=cls.report, contributor_name='Jane Roe',
+                         amount=Decimal('100.00'), date_received=date(2024, 2, 15)),
+        ])
+        Expenditure.objects.create(
+            report=cls.report,
+            recipient_name='ABC Consulting',
+            amount=Decimal('250.00'),
+            date=date(2024, 2, 1)
+        )
 
+    def setUp(self):
+        """Start each test with an empty page cache."""
+        cache.clear()
+
+    def test_global_timeline_groups_by_month(self):
+        """Test that monthly totals come from one GROUP BY query per table."""
+        with self.assertNumQueries(2):
+            response = self.client.get(reverse('disclosures:api_global_timeline'))
+        self.assertEqual(response.json(), {
+            'contributions': [
+                {'date': '2024-01-01', 'amount': 800.0, 'count': 2},
+                {'date': '2024-02-01', 'amount': 100.0, 'count': 1},
+            ],
+            'expenditures': [
+                {'date': '2024-02-01', 'amount': 250.0, 'count': 1},
+            ],
+        })
+        with self.assertNumQueries(0):
+            self.client.get(reverse('disclosures:api_global_timeline'))
+
+    def test_report_timeline_groups_by_day(self):
+        """Test that daily report totals are aggregated in the database."""
+        # Report lookup, then one UNION ALL of the contribution and expenditure GROUP BYs
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                reverse('disclosures:api_report_timeline', args=['12345'])
+            )
+        self.assertEqual(response.json(), {
+            'contributions': [
+                {'date': '2024-01-15', 'amount': 500.0, 'count': 1},
+                {'date': '2024-01-20', 'amount': 300.0, 'count': 1},
+                {'date': '2024-02-15', 'amount': 100.0, 'count': 1},
+            ],
+            'expenditures': [
+                {'date': '2024-02-01', 'amount': 250.0, 'count': 1},
+            ],
+        })
+
+    def test_report_top_contributors_cached(self):
+        """Test that per-report top contributors are aggregated once, then cached."""
+        url = reverse('disclosures:api_report_top_contributors', args=['12345'])
+        with self.assertNumQueries(2):
+            response = self.client.get(url)
+        self.assertEqual(response.json(), [
+            {'name': 'John Doe', 'amount': 800.0},
+            {'name': 'Jane Roe', 'amount': 100.0},
+        ])
+        with self.assertNumQueries(0):
+            self.assertEqual(self.client.get(url).json(), response.json())
+
+    def test_contributor_timeline_single_query(self):
+        """Test that a contributor timeline is one aggregate query."""
+        with self.assertNumQueries(1):
+            response = self.client.get(
+                reverse('disclosures:api_contributor_timeline', args=['John Doe'])
+            )
+        self.assertEqual(response.json(), [
+            {'date': '2024-01-15', 'amount': 500.0, 'count': 1},
+            {'date': '2024-01-20', 'amount': 300.0, 'count': 1},
+        ])
+
+
+class PACDetailViewTest(TestCase):
+    """Test PAC detail view."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data."""
         # Create reports for the same PAC
-        for i in range(3):
-            report = DisclosureReport.objects.create(
+        reports = DisclosureReport.objects.bulk_create([
+            DisclosureReport(
                 report_id=f'REPORT{i}',
                 source_url=f'https://example.com/report/{i}',
                 organization_name='Test PAC',
@@ -190,15 +470,20 @@ class PACDetailViewTest(TestCase):
                 total_contributions=Decimal('1000.00'),
                 total_expenditures=Decimal('500.00')
             )
+            for i in range(3)
+        ])
 
-            Contribution.objects.create(
+        Contribution.objects.bulk_create([
+            Contribution(
                 report=report,
                 contributor_name=f'Donor {i}',
                 amount=Decimal('100.00')
             )
+            for i, report in enumerate(reports)
+        ])
 
         # Create entity registration
-        self.entity = EntityRegistration.objects.create(
+        cls.entity = EntityRegistration.objects.create(
             entity_id='850',
             source_url='https://disclosures.utah.gov/Registration/EntityDetails/850',
             name='Test PAC',
@@ -207,7 +492,7 @@ class PACDetailViewTest(TestCase):
         )
 
         EntityOfficer.objects.create(
-            entity=self.entity,
+            entity=cls.entity,
             name='Test Officer',
             title='Chair',
             order=0
@@ -215,9 +500,11 @@ class PACDetailViewTest(TestCase):
 
     def test_pac_detail_view_loads(self):
         """Test that PAC detail view loads successfully."""
-        response = self.client.get(
-            reverse('disclosures:pac_detail', args=['Test PAC'])
-        )
+        # Officers come from one prefetch query; nothing runs per officer or per report
+        with self.assertNumQueries(13):
+            response = self.client.get(
+                reverse('disclosures:pac_detail', args=['Test PAC'])
+            )
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'disclosures/pac_detail.html')
 
@@ -234,29 +521,32 @@ class PACDetailViewTest(TestCase):
 class SearchViewTest(TestCase):
     """Test global search view."""
 
-    def setUp(self):
-        """Set up test data and client."""
-        self.client = Client()
-
-        self.report = DisclosureReport.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data."""
+        cls.report = DisclosureReport.objects.create(
             report_id='12345',
             source_url='https://example.com/report/12345',
             organization_name='Utah Test PAC',
             organization_type='Political Action Committee'
         )
 
-        self.entity = EntityRegistration.objects.create(
+        cls.entity = EntityRegistration.objects.create(
             entity_id='850',
             source_url='https://disclosures.utah.gov/Registration/EntityDetails/850',
             name='Utah Association Of Realtors'
         )
 
         Contribution.objects.create(
-            report=self.report,
+            report=cls.report,
             contributor_name='John Smith',
             amount=Decimal('500.00')
         )
 
+    def setUp(self):
+        """Start each test with an empty page cache."""
+        cache.clear()
+
     def test_search_view_loads(self):
         """Test that search view loads successfully."""
         response = self.client.get(reverse('disclosures:search'))
@@ -290,6 +580,13 @@ class SearchViewTest(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertTrue(len(response.context['contributors']) > 0)
 
+    def test_search_is_cached(self):
+        """Test that repeating a search is served from the cache."""
+        self.client.get(reverse('disclosures:search'), {'q': 'Utah'})
+        with self.assertNumQueries(0):
+            response = self.client.get(reverse('disclosures:search'), {'q': 'Utah'})
+        self.assertContains(response, 'Utah Test PAC')
+
     def test_empty_search(self):
         """Test search with no query."""
         response = self.client.get(reverse('disclosures:search'))
@@ -300,11 +597,10 @@ class SearchViewTest(TestCase):
 class OutOfStateViewTest(TestCase):
     """Test out-of-state contributions view."""
 
-    def setUp(self):
-        """Set up test data and client."""
-        self.client = Client()
-
-        self.report = DisclosureReport.objects.create(
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data."""
+        cls.report = DisclosureReport.objects.create(
             report_id='12345',
             source_url='https://example.com/report/12345',
             organization_name='Test PAC',
@@ -313,17 +609,20 @@ class OutOfStateViewTest(TestCase):
 
         # Add out-of-state contributions
         Contribution.objects.create(
-            report=self.report,
+            report=cls.report,
             contributor_name='California Donor',
             address='123 Main St, Los Angeles, CA 90001',
+            state='CA',
+            is_out_of_state=True,
             amount=Decimal('1000.00')
         )
 
         # Add in-state contribution
         Contribution.objects.create(
-            report=self.report,
+            report=cls.report,
             contributor_name='Utah Donor',
             address='456 State St, Salt Lake City, UT 84101',
+            state='UT',
             amount=Decimal('500.00')
         )
 
@@ -333,14 +632,196 @@ class OutOfStateViewTest(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertTemplateUsed(response, 'disclosures/out_of_state.html')
 
+    def test_out_of_state_groups_by_state(self):
+        """Test that only out-of-state contributions are totalled, per state."""
+        response = self.client.get(reverse('disclosures:out_of_state'))
+        self.assertEqual(response.context['state_list'], [{
+            'state': 'CA',
+            'total_amount': Decimal('1000.00'),
+            'contribution_count': 1,
+            'contributor_count': 1,
+        }])
+        self.assertEqual(response.context['total_out_of_state_amount'], Decimal('1000.00'))
+
+    def test_state_contributions_totals_cover_every_row(self):
+        """Test that the state totals include rows past the 100 listed."""
+        # bulk_create skips save(), so the state columns are set here
+        Contribution.objects.bulk_create([
+            Contribution(report=self.report, contributor_name=f'Nevada Donor {i}',
+                         address='1 Strip Ave, Las Vegas, NV 89101', state='NV',
+                         is_out_of_state=True, amount=Decimal('10.00'), date_received=date(2024, 1, 1))
+            for i in range(105)
+        ])
+        with self.assertNumQueries(1):
+            response = self.client.get(reverse('disclosures:api_state_contributions', args=['nv']))
+        data = response.json()
+        self.assertEqual(len(data['contributions']), 100)
+        self.assertEqual(data['total_count'], 105)
+        self.assertEqual(data['total_amount'], 1050.0)
+        first = data['contributions'][0]
+        self.assertTrue(first.pop('contributor_name').startswith('Nevada Donor'))
+        self.assertEqual(first, {
+            'address': '1 Strip Ave, Las Vegas, NV 89101',
+            'amount': 10.0,
+            'date': '2024-01-01',
+            'organization': 'Test PAC',
+            'report_id': '12345',
+        })
+
+    def test_state_contributions_empty_state(self):
+        """Test a state with no contributions."""
+        response = self.client.get(reverse('disclosures:api_state_contributions', args=['WY']))
+        self.assertEqual(response.json(), {
+            'state': 'WY',
+            'contributions': [],
+            'total_amount': 0.0,
+            'total_count': 0,
+        })
+
+
+class InStateAPITest(TestCase):
+    """Test the in-state percentage API endpoints."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data."""
+        candidate_report = DisclosureReport.objects.create(
+            report_id='C1',
+            source_url='https://example.com/report/C1',
+            organization_name='Jane Doe',
+            organization_type='Candidates & Office Holders'
+        )
+        pac_report = DisclosureReport.objects.create(
+            report_id='P1',
+            source_url='https://example.com/report/P1',
+            organization_name='Good Government PAC',
+            organization_type='Political Action Committee'
+        )
+        Contribution.objects.bulk_create([
+            # Direct in-state contribution, plus money from the PAC
+            Contribution(report=candidate_report, contributor_name='John Doe',
+                         address='123 Main St, Salt Lake City, UT 84101', amount=Decimal('500.00')),
+            Contribution(report=candidate_report, contributor_name='Good Government PAC',
+                         address='PO Box 1, Provo, UT 84601', amount=Decimal('1000.00')),
+            # The PAC raises 75% in state
+            Contribution(report=pac_report, contributor_name='Ann Smith',
+                         address='5 Elm St, Ogden, UT 84401', amount=Decimal('300.00')),
+            Contribution(report=pac_report, contributor_name='Bob Jones',
+                         address='9 Pine St, Fresno, CA 93650', amount=Decimal('100.00')),
+        ])
+
+    def setUp(self):
+        """Start each test with an empty page cache."""
+        cache.clear()
+
+    def test_candidate_instate_weights_pac_contributions(self):
+        """Test that PAC money is split by the PAC's own in-state share without per-row queries."""
+        # Candidate check, candidate contributions, PAC names, PAC totals by address
+        with self.assertNumQueries(4):
+            response = self.client.get(
+                reverse('disclosures:api_candidate_instate_percentage', args=['Jane Doe'])
+            )
+        data = response.json()
+        self.assertEqual(data['instate_amount'], 1250.0)
+        self.assertEqual(data['outstate_amount'], 250.0)
+        self.assertEqual(data['instate_percentage'], 83.3)
+        self.assertEqual(data['total_amount'], 1500.0)
+
+    def test_pac_instate_percentage(self):
+        """Test that a PAC's totals come from one query grouped by address."""
+        # PAC check, then contribution totals by address
+        with self.assertNumQueries(2):
+            response = self.client.get(
+                reverse('disclosures:api_pac_instate_percentage', args=['Good Government PAC'])
+            )
+        data = response.json()
+        self.assertEqual(data['instate_amount'], 300.0)
+        self.assertEqual(data['outstate_amount'], 100.0)
+        self.assertEqual(data['unknown_amount'], 0.0)
+        self.assertEqual(data['instate_percentage'], 75.0)
+        with self.assertNumQueries(0):
+            self.client.get(
+                reverse('disclosures:api_pac_instate_percentage', args=['Good Government PAC'])
+            )
+
+
+class CandidateSankeyAPITest(TestCase):
+    """Test the candidate Sankey API endpoint."""
+
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data."""
+        def report(report_id, name, org_type='Political Action Committee'):
+            return DisclosureReport.objects.create(
+                report_id=report_id,
+                source_url=f'https://example.com/report/{report_id}',
+                organization_name=name,
+                organization_type=org_type
+            )
+
+        candidate = report('C1', 'Jane Doe', 'Candidates & Office Holders')
+        good_pac = report('P1', 'Good Government PAC')
+        # Created in this order, so the Alliance has the newest report
+        energy_pac = report('P2', 'Utah Energy PAC')
+        energy_alliance = report('P3', 'Utah Energy Alliance')
+        report('P4', 'Quiet PAC')  # Files reports but has no contributors
+
+        Contribution.objects.bulk_create([
+            # Exact match, fuzzy match for both Utah Energy PACs, a PAC with no
+            # contributors, and an individual
+            Contribution(report=candidate, contributor_name='Good Government PAC', amount=Decimal('3000.00')),
+            Contribution(report=candidate, contributor_name='Utah Energy', amount=Decimal('2000.00')),
+            Contribution(report=candidate, contributor_name='Quiet PAC', amount=Decimal('1500.00')),
+            Contribution(report=candidate, contributor_name='John Doe', amount=Decimal('500.00')),
+            Contribution(report=good_pac, contributor_name='Ann Smith', amount=Decimal('300.00')),
+            Contribution(report=good_pac, contributor_name='Bob Jones', amount=Decimal('100.00')),
+            Contribution(report=energy_pac, contributor_name='Ann Smith', amount=Decimal('200.00')),
+            Contribution(report=energy_pac, contributor_name='Carl Poe', amount=Decimal('50.00')),
+            Contribution(report=energy_alliance, contributor_name='Dana Wu', amount=Decimal('400.00')),
+            # The candidate is left out of a PAC's contributors
+            Contribution(report=energy_alliance, contributor_name='Jane Doe', amount=Decimal('999.00')),
+        ])
+
+    def test_candidate_sankey(self):
+        """Test PAC matching and the nodes/links payload."""
+        # Direct contributions, PAC names, then top contributors of each matched PAC
+        with self.assertNumQueries(5):
+            response = self.client.get(
+                reverse('disclosures:api_candidate_sankey', args=['Jane Doe'])
+            )
+        self.assertEqual(response.json(), {
+            'nodes': [
+                {'name': 'Ann Smith'},
+                {'name': 'Bob Jones'},
+                {'name': 'Dana Wu'},
+                {'name': 'Carl Poe'},
+                {'name': 'John Doe'},
+                {'name': 'Good Government PAC'},
+                # "Utah Energy" matches both PACs; the newest report names the node
+                {'name': 'Utah Energy Alliance'},
+                {'name': 'Jane Doe'},
+            ],
+            'links': [
+                {'source': 0, 'target': 5, 'value': 300.0},
+                {'source': 1, 'target': 5, 'value': 100.0},
+                # Contributors of both Utah Energy PACs, combined
+                {'source': 2, 'target': 6, 'value': 400.0},
+                {'source': 0, 'target': 6, 'value': 200.0},
+                {'source': 3, 'target': 6, 'value': 50.0},
+                {'source': 5, 'target': 7, 'value': 3000.0},
+                {'source': 6, 'target': 7, 'value': 2000.0},
+                # Quiet PAC has no contributors to show, so it is left out
+                {'source': 4, 'target': 7, 'value': 500.0},
+            ],
+        })
+
 
 class YearFilteringTest(TestCase):
     """Test year filtering functionality."""
 
-    def setUp(self):
-        """Set up test data and client."""
-        self.client = Client()
-
+    @classmethod
+    def setUpTestData(cls):
+        """Set up test data."""
         # Create reports from different years
         DisclosureReport.objects.create(
             report_id='2023-REPORT',
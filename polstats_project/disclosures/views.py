@@ -1,57 +1,160 @@
 from django.shortcuts import render, get_object_or_404
-from django.http import JsonResponse
-from django.db import models
-from django.db.models import Sum, Count, Q, Min, Max
-from django.db.models.functions import TruncMonth, TruncDay, ExtractYear
+from django.http import HttpResponse
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Avg, Sum, Count, Q, Min, Max, Prefetch, Value, Window
+from django.db.models.functions import Coalesce, TruncMonth, TruncDay, ExtractYear
+from django.utils.functional import cached_property
+from django.core.cache import cache
 from django.core.paginator import Paginator
+from django.views.decorators.cache import cache_page
 from django_ratelimit.decorators import ratelimit
-from .models import DisclosureReport, Contribution, Expenditure
+from .models import DisclosureReport, Contribution, Expenditure, EntityOfficer
 from decimal import Decimal
+from functools import lru_cache
 from urllib.parse import unquote
+import hashlib
+import orjson
+import re
+
+# How long cached pages (index, about, the global timeline, the per-report
+# top-10 charts and the in-state percentages) and grouped list counts are
+# served from the cache. Imports run in separate processes, so entries expire
+# on this timeout rather than on save.
+PAGE_CACHE_SECONDS = 60 * 15
+
+# Search results are cached briefly (keyed on the full URL, so per ?q=): repeated
+# and popular queries skip the four icontains scans
+SEARCH_CACHE_SECONDS = 60
+
+# Columns the reports_list table renders
+REPORT_LIST_ROW_FIELDS = (
+    'report_id', 'organization_name', 'title', 'organization_type', 'report_type',
+    'total_contributions', 'total_expenditures', 'ending_balance',
+)
+
+# Columns the recent-reports table on the PAC page renders
+PAC_REPORT_ROW_FIELDS = (
+    'report_id', 'report_type', 'begin_date', 'end_date',
+    'total_contributions', 'total_expenditures', 'ending_balance',
+)
+
+# Columns the PAC page's transaction tables render
+PAC_CONTRIBUTION_ROW_FIELDS = ('contributor_name', 'date_received', 'address', 'amount')
+PAC_EXPENDITURE_ROW_FIELDS = ('recipient_name', 'date', 'purpose', 'amount')
+
+# Columns (including the joined report's) the contributor page's table renders
+CONTRIBUTOR_ROW_FIELDS = (
+    'date_received', 'date_received_raw', 'address', 'amount', 'is_in_kind', 'is_loan', 'is_amendment',
+    'report__report_id', 'report__organization_name', 'report__title',
+)
+
+
+# Fallback for types orjson can't encode itself (e.g. Decimal -> str, as JsonResponse did)
+_json_default = DjangoJSONEncoder().default
+
+
+def json_response(data, status=200):
+    """Like JsonResponse(data), but serialized with orjson."""
+    return HttpResponse(
+        orjson.dumps(data, default=_json_default),
+        content_type='application/json',
+        status=status,
+    )
 
 
-def get_year_filtered_reports(request):
-    """Get reports filtered by year from query params."""
-    reports = DisclosureReport.objects.all()
-    year = request.GET.get('year')
-    if year:
+def timeline_points(rows, period):
+    """
+    Chart points for a period/total/count aggregation.
+    Reads the rows with .iterator() so the QuerySet doesn't keep a second copy of them.
+    """
+    return [
+        {
+            'date': item[period],
+            'amount': float(item['total']),
+            'count': item['count']
+        }
+        for item in rows.iterator(chunk_size=1000)
+    ]
+
+
+class CachedCountPaginator(Paginator):
+    """
+    Paginator that caches its total count. Counting a values().annotate() list runs
+    the whole GROUP BY again inside SELECT COUNT(*), on every page request.
+    """
+
+    @cached_property
+    def count(self):
+        key = 'paginator-count:' + hashlib.md5(str(self.object_list.query).encode()).hexdigest()
+        count = cache.get(key)
+        if count is None:
+            count = super().count
+            cache.set(key, count, PAGE_CACHE_SECONDS)
+        return count
+
+
+class DeferredJoinPaginator(Paginator):
+    """
+    Paginator for model QuerySets with wide rows. Past page 1 the OFFSET runs over
+    primary keys only and just that page's rows are loaded, so deep pages don't
+    read every full row before them only to throw it away.
+    """
+
+    def page(self, number):
+        number = self.validate_number(number)
+        if number == 1:
+            return super().page(number)
+        bottom = (number - 1) * self.per_page
+        top = bottom + self.per_page
+        if top + self.orphans >= self.count:
+            top = self.count
+        pks = list(self.object_list.values_list('pk', flat=True)[bottom:top])
+        rows = self.object_list.in_bulk(pks)
+        return self._get_page([rows[pk] for pk in pks if pk in rows], number, self)
+
+
+def get_selected_year(request):
+    """The ?year= query param as an int, or None; parsed once and kept on the request."""
+    if not hasattr(request, '_selected_year'):
+        year = request.GET.get('year')
         try:
-            year = int(year)
-            reports = reports.filter(end_date__year=year)
+            request._selected_year = int(year) if year else None
         except (ValueError, TypeError):
-            pass
-    return reports
+            request._selected_year = None
+    return request._selected_year
+
+
+def get_year_filtered_reports(request):
+    """Get reports filtered by year from query params."""
+    year = get_selected_year(request)
+    if year is not None:
+        return DisclosureReport.objects.filter(end_date__year=year)
+    return DisclosureReport.objects.all()
 
 
 def get_year_filtered_contributions(request):
     """Get contributions filtered by year from query params."""
-    year = request.GET.get('year')
-    if year:
-        try:
-            year = int(year)
-            return Contribution.objects.filter(report__end_date__year=year)
-        except (ValueError, TypeError):
-            pass
+    year = get_selected_year(request)
+    if year is not None:
+        return Contribution.objects.filter(report__end_date__year=year)
     return Contribution.objects.all()
 
 
 def get_year_filtered_expenditures(request):
     """Get expenditures filtered by year from query params."""
-    year = request.GET.get('year')
-    if year:
-        try:
-            year = int(year)
-            return Expenditure.objects.filter(report__end_date__year=year)
-        except (ValueError, TypeError):
-            pass
+    year = get_selected_year(request)
+    if year is not None:
+        return Expenditure.objects.filter(report__end_date__year=year)
     return Expenditure.objects.all()
 
 
+@cache_page(PAGE_CACHE_SECONDS)
 def about(request):
     """About page."""
     return render(request, 'disclosures/about.html')
 
 
+@cache_page(PAGE_CACHE_SECONDS)
 def index(request):
     """Homepage with overview statistics."""
     # Get year-filtered querysets
@@ -59,20 +162,22 @@ def index(request):
     contributions = get_year_filtered_contributions(request)
     expenditures = get_year_filtered_expenditures(request)
 
+    # One aggregate query per table instead of a count() and a Sum() each.
+    # DisclosureReport.total_contributions/total_expenditures are the filer's own
+    # summary figures (they include unitemized amounts), so they can't stand in here.
+    contrib_totals = contributions.aggregate(count=Count('id'), total=Sum('amount'))
+    exp_totals = expenditures.aggregate(count=Count('id'), total=Sum('amount'))
     stats = {
         'total_reports': reports.count(),
-        'total_contributions': contributions.count(),
-        'total_expenditures': expenditures.count(),
-        'total_contribution_amount': contributions.aggregate(
-            total=Sum('amount')
-        )['total'] or Decimal('0'),
-        'total_expenditure_amount': expenditures.aggregate(
-            total=Sum('amount')
-        )['total'] or Decimal('0'),
+        'total_contributions': contrib_totals['count'],
+        'total_expenditures': exp_totals['count'],
+        'total_contribution_amount': contrib_totals['total'] or Decimal('0'),
+        'total_expenditure_amount': exp_totals['total'] or Decimal('0'),
     }
 
-    # Recent reports
-    recent_reports = reports[:10]
+    # Recent reports (served by the -created_at index; only the three columns the
+    # table shows, since report_info can be large)
+    recent_reports = reports.only('report_id', 'title', 'ending_balance')[:10]
 
     # Top contributors
     top_contributors = (
@@ -127,13 +232,14 @@ def reports_list(request):
     # Sorting
     sort = request.GET.get('sort', '-created_at')
     if sort in ['created_at', '-created_at', 'ending_balance', '-ending_balance', 'report_id', '-report_id', 'organization_name', '-organization_name']:
-        reports = reports.order_by(sort)
+        # pk breaks ties so a report can't show up on two pages
+        reports = reports.order_by(sort, '-pk')
 
     # Get distinct organization types for filter dropdown
     org_types = DisclosureReport.objects.exclude(organization_type='').values_list('organization_type', flat=True).distinct().order_by('organization_type')
 
-    # Pagination
-    paginator = Paginator(reports, 25)
+    # Pagination (only the columns the table shows; report_info can be large)
+    paginator = DeferredJoinPaginator(reports.only(*REPORT_LIST_ROW_FIELDS), 25)
     page_number = request.GET.get('page', 1)
     page_obj = paginator.get_page(page_number)
 
@@ -214,7 +320,7 @@ def contributors_list(request):
         )
 
     # Pagination
-    paginator = Paginator(contributors, 50)
+    paginator = CachedCountPaginator(contributors, 50)
     page_number = request.GET.get('page', 1)
     page_obj = paginator.get_page(page_number)
 
@@ -252,7 +358,7 @@ def expenditures_list(request):
         )
 
     # Pagination
-    paginator = Paginator(recipients, 50)
+    paginator = CachedCountPaginator(recipients, 50)
     page_number = request.GET.get('page', 1)
     page_obj = paginator.get_page(page_number)
 
@@ -276,8 +382,8 @@ def api_report_timeline(request, report_id):
         .exclude(date_received=None)
         .annotate(day=TruncDay('date_received'))
         .values('day')
-        .annotate(total=Sum('amount'), count=Count('id'))
-        .order_by('day')
+        .annotate(total=Sum('amount'), count=Count('id'), kind=Value('contributions'))
+        .order_by()
     )
 
     # Daily expenditures
@@ -286,33 +392,24 @@ def api_report_timeline(request, report_id):
         .exclude(date=None)
         .annotate(day=TruncDay('date'))
         .values('day')
-        .annotate(total=Sum('amount'), count=Count('id'))
-        .order_by('day')
+        .annotate(total=Sum('amount'), count=Count('id'), kind=Value('expenditures'))
+        .order_by()
     )
 
-    data = {
-        'contributions': [
-            {
-                'date': item['day'].isoformat(),
-                'amount': float(item['total']),
-                'count': item['count']
-            }
-            for item in daily_contributions
-        ],
-        'expenditures': [
-            {
-                'date': item['day'].isoformat(),
-                'amount': float(item['total']),
-                'count': item['count']
-            }
-            for item in daily_expenditures
-        ]
-    }
+    # Both GROUP BYs in one round trip (UNION ALL); kind says which list a row belongs to
+    data = {'contributions': [], 'expenditures': []}
+    for item in daily_contributions.union(daily_expenditures, all=True).order_by('day'):
+        data[item['kind']].append({
+            'date': item['day'],
+            'amount': float(item['total']),
+            'count': item['count']
+        })
 
-    return JsonResponse(data)
+    return json_response(data)
 
 
 @ratelimit(key='ip', rate='100/h', method='GET')
+@cache_page(PAGE_CACHE_SECONDS)
 def api_report_top_contributors(request, report_id):
     """API endpoint for top contributors chart data."""
     report = get_object_or_404(DisclosureReport, report_id=report_id)
@@ -332,10 +429,11 @@ def api_report_top_contributors(request, report_id):
         for item in top_contributors
     ]
 
-    return JsonResponse(data, safe=False)
+    return json_response(data)
 
 
 @ratelimit(key="ip", rate="100/h", method="GET")
+@cache_page(PAGE_CACHE_SECONDS)
 def api_report_top_expenditures(request, report_id):
     """API endpoint for top expenditure recipients chart data."""
     report = get_object_or_404(DisclosureReport, report_id=report_id)
@@ -355,10 +453,11 @@ def api_report_top_expenditures(request, report_id):
         for item in top_recipients
     ]
 
-    return JsonResponse(data, safe=False)
+    return json_response(data)
 
 
 @ratelimit(key="ip", rate="100/h", method="GET")
+@cache_page(PAGE_CACHE_SECONDS)
 def api_global_timeline(request):
     """API endpoint for global contribution/expenditure timeline."""
     # Monthly contributions
@@ -382,25 +481,11 @@ def api_global_timeline(request):
     )
 
     data = {
-        'contributions': [
-            {
-                'date': item['month'].isoformat(),
-                'amount': float(item['total']),
-                'count': item['count']
-            }
-            for item in monthly_contributions
-        ],
-        'expenditures': [
-            {
-                'date': item['month'].isoformat(),
-                'amount': float(item['total']),
-                'count': item['count']
-            }
-            for item in monthly_expenditures
-        ]
+        'contributions': timeline_points(monthly_contributions, 'month'),
+        'expenditures': timeline_points(monthly_expenditures, 'month')
     }
 
-    return JsonResponse(data)
+    return json_response(data)
 
 
 def contributor_detail(request, contributor_name):
@@ -413,18 +498,20 @@ def contributor_detail(request, contributor_name):
         contributor_name=contributor_name
     ).select_related('report').order_by('-date_received')
 
-    if not contributions.exists():
+    # The 100 most recent contributions for display; the newest one's address is
+    # shown in the header, and an empty list doubles as the existence check
+    recent_contributions = list(contributions.only(*CONTRIBUTOR_ROW_FIELDS)[:100])
+    if not recent_contributions:
         from django.http import Http404
         raise Http404("Contributor not found")
+    address = recent_contributions[0].address
 
-    # Get first contribution for address info
-    first_contrib = contributions.first()
-
-    # Calculate statistics
+    # Calculate statistics in one aggregate query. Avg rather than Sum / Count:
+    # SQLite stores whole-dollar amounts as integers and would divide them as such.
     stats = contributions.aggregate(
-        total_amount=Sum('amount'),
+        total_amount=Coalesce(Sum('amount'), Decimal('0')),
         contribution_count=Count('id'),
-        avg_amount=Sum('amount') / Count('id') if contributions.count() > 0 else 0,
+        avg_amount=Avg('amount'),
         first_contribution=Min('date_received'),
         last_contribution=Max('date_received')
     )
@@ -455,8 +542,8 @@ def contributor_detail(request, contributor_name):
 
     context = {
         'contributor_name': contributor_name,
-        'address': first_contrib.address,
-        'contributions': contributions[:100],  # Limit to 100 for display
+        'address': address,
+        'contributions': recent_contributions,  # Limit to 100 for display
         'stats': stats,
         'by_organization': by_organization,
         'by_year': by_year,
@@ -481,16 +568,9 @@ def api_contributor_timeline(request, contributor_name):
         .order_by('day')
     )
 
-    data = [
-        {
-            'date': item['day'].isoformat(),
-            'amount': float(item['total']),
-            'count': item['count']
-        }
-        for item in daily_contributions
-    ]
+    data = timeline_points(daily_contributions, 'day')
 
-    return JsonResponse(data, safe=False)
+    return json_response(data)
 
 
 def pacs_list(request):
@@ -517,7 +597,8 @@ def pacs_list(request):
             report_count=Count('id'),
             latest_report=Max('end_date')
         )
-        .order_by('-total_contributions')
+        # Tie-break on name so LIMIT/OFFSET pages are stable
+        .order_by('-total_contributions', 'organization_name')
     )
 
     # Search
@@ -525,8 +606,8 @@ def pacs_list(request):
     if search:
         pacs = pacs.filter(Q(organization_name__icontains=search))
 
-    # Pagination
-    paginator = Paginator(list(pacs), 25)
+    # Pagination (LIMIT/OFFSET in the database rather than slicing every PAC in Python)
+    paginator = CachedCountPaginator(pacs, 25)
     page_number = request.GET.get('page', 1)
     page_obj = paginator.get_page(page_number)
 
@@ -552,13 +633,13 @@ def pac_detail(request, organization_name):
         organization_type__icontains='Political Action Committee'
     )
 
-    if not all_pac_reports.exists():
+    # Get first report for organization info (from all reports, not year-filtered);
+    # fetching it doubles as the existence check
+    first_report = all_pac_reports.only('organization_type').first()
+    if first_report is None:
         from django.http import Http404
         raise Http404("PAC not found")
 
-    # Get first report for organization info (from all reports, not year-filtered)
-    first_report = all_pac_reports.first()
-
     # Now get year-filtered reports for stats
     reports = get_year_filtered_reports(request)
     pac_reports = reports.filter(
@@ -575,12 +656,16 @@ def pac_detail(request, organization_name):
         latest_report=Max('end_date')
     )
 
-    # Get all contributions and expenditures for this PAC
+    # Get all contributions and expenditures for this PAC. Filtering through the
+    # report join (which the year filter already uses) instead of report__in=pac_reports
+    # avoids a report subquery in each of the queries below.
     contributions = get_year_filtered_contributions(request).filter(
-        report__in=pac_reports
+        report__organization_name=organization_name,
+        report__organization_type__icontains='Political Action Committee'
     )
     expenditures = get_year_filtered_expenditures(request).filter(
-        report__in=pac_reports
+        report__organization_name=organization_name,
+        report__organization_type__icontains='Political Action Committee'
     )
 
     # Top contributors
@@ -623,21 +708,30 @@ def pac_detail(request, organization_name):
     # Calculate net balance
     net_balance = (stats['total_contributions'] or Decimal('0')) - (stats['total_expenditures'] or Decimal('0'))
 
-    # Get all contributions and expenditures ordered by date
-    all_contributions = contributions.order_by('-date_received')
-    all_expenditures = expenditures.order_by('-date')
+    # Get all contributions and expenditures ordered by date. The tables only show
+    # their own columns (never the report), so no join and no other columns.
+    all_contributions = contributions.only(*PAC_CONTRIBUTION_ROW_FIELDS).order_by('-date_received')
+    all_expenditures = expenditures.only(*PAC_EXPENDITURE_ROW_FIELDS).order_by('-date')
 
     # Try to find entity registration data
     # Try exact match first, then case-insensitive
+    # The template checks and then lists the officers, so load them into a plain list in one query
     from .models import EntityRegistration
-    entity = EntityRegistration.objects.filter(name__iexact=organization_name).first()
+    entity = (
+        EntityRegistration.objects
+        .filter(name__iexact=organization_name)
+        .prefetch_related(Prefetch(
+            'officers', queryset=EntityOfficer.objects.order_by('order'), to_attr='officer_list'
+        ))
+        .first()
+    )
 
     context = {
         'organization_name': organization_name,
         'organization_type': first_report.organization_type,
         'stats': stats,
         'net_balance': net_balance,
-        'pac_reports': pac_reports[:10],  # Recent reports
+        'pac_reports': pac_reports.only(*PAC_REPORT_ROW_FIELDS)[:10],  # Recent reports
         'top_contributors': top_contributors,
         'top_recipients': top_recipients,
         'contrib_stats': contrib_stats,
@@ -665,178 +759,84 @@ def api_pac_sankey(request, organization_name):
     )
 
     # Get contributions (inflows) - exclude self-contributions
-    contributions = (
+    contributions = list(
         get_year_filtered_contributions(request)
         .filter(report__in=pac_reports)
         .exclude(contributor_name=organization_name)  # Exclude circular references
-        .values('contributor_name')
+        .values_list('contributor_name')
         .annotate(total=Sum('amount'))
         .order_by('-total')[:15]  # Top 15 contributors
     )
 
     # Get expenditures (outflows) - exclude self-expenditures
-    expenditures = (
+    expenditures = list(
         get_year_filtered_expenditures(request)
         .filter(report__in=pac_reports)
         .exclude(recipient_name=organization_name)  # Exclude circular references
-        .values('recipient_name')
+        .values_list('recipient_name')
         .annotate(total=Sum('amount'))
         .order_by('-total')[:15]  # Top 15 recipients
     )
 
-    # Build nodes and links for Sankey diagram
-    nodes = []
-    links = []
-
-    # Get names from both lists
-    contributor_names = set(c['contributor_name'] for c in contributions)
-    recipient_names = set(r['recipient_name'] for r in expenditures)
-
     # Find entities that appear in both lists (would create cycles if not handled)
-    circular_entities = contributor_names & recipient_names
+    circular_entities = {name for name, _ in contributions} & {name for name, _ in expenditures}
 
-    # Build node map
+    # Build nodes and links for Sankey diagram
+    nodes = []
     node_map = {}
-    node_index = 0
-
-    # Add contributor nodes (sources)
-    # For circular entities, append " (Contributor)" to make them unique
-    for contrib in contributions:
-        base_name = contrib['contributor_name']
-        if base_name in circular_entities:
-            node_name = f"{base_name} (Contributor)"
-        else:
-            node_name = base_name
-
-        if node_name not in node_map:
-            node_map[node_name] = node_index
-            nodes.append({'name': node_name})
-            node_index += 1
 
-    # Add PAC node (middle)
-    pac_node_index = node_index
+    def add_node(name, role):
+        """Return the node index for name, adding the node on first sight."""
+        # For circular entities, append " (Contributor)" / " (Recipient)" to make them unique
+        if name in circular_entities:
+            name = f"{name} ({role})"
+        if name not in node_map:
+            node_map[name] = len(nodes)
+            nodes.append({'name': name})
+        return node_map[name]
+
+    # Contributor nodes (sources), then the PAC node (middle), then recipient nodes (targets)
+    sources = [(add_node(name, 'Contributor'), total) for name, total in contributions]
+    pac_node_index = len(nodes)
     node_map[organization_name] = pac_node_index
     nodes.append({'name': organization_name})
-    node_index += 1
-
-    # Add recipient nodes (targets)
-    # For circular entities, append " (Recipient)" to make them unique
-    for exp in expenditures:
-        base_name = exp['recipient_name']
-        if base_name in circular_entities:
-            node_name = f"{base_name} (Recipient)"
-        else:
-            node_name = base_name
-
-        if node_name not in node_map:
-            node_map[node_name] = node_index
-            nodes.append({'name': node_name})
-            node_index += 1
-
-    # Add links from contributors to PAC
-    for contrib in contributions:
-        base_name = contrib['contributor_name']
-        if base_name in circular_entities:
-            source_name = f"{base_name} (Contributor)"
-        else:
-            source_name = base_name
-
-        links.append({
-            'source': node_map[source_name],
-            'target': pac_node_index,
-            'value': float(contrib['total'])
-        })
-
-    # Add links from PAC to recipients
-    for exp in expenditures:
-        base_name = exp['recipient_name']
-        if base_name in circular_entities:
-            target_name = f"{base_name} (Recipient)"
-        else:
-            target_name = base_name
-
-        links.append({
-            'source': pac_node_index,
-            'target': node_map[target_name],
-            'value': float(exp['total'])
-        })
+    targets = [(add_node(name, 'Recipient'), total) for name, total in expenditures]
+
+    # Links from contributors to PAC, then from PAC to recipients
+    links = [
+        {'source': source, 'target': pac_node_index, 'value': float(total)}
+        for source, total in sources
+    ] + [
+        {'source': pac_node_index, 'target': target, 'value': float(total)}
+        for target, total in targets
+    ]
 
     data = {
         'nodes': nodes,
         'links': links
     }
 
-    return JsonResponse(data)
+    return json_response(data)
 
 
 def out_of_state(request):
     """Out-of-state contribution statistics with map visualization."""
-    import re
-
-    # Get year-filtered contributions (exclude empty addresses at database level)
-    contributions = get_year_filtered_contributions(request).exclude(
-        address=''
-    ).exclude(address=None)
-
-    # Filter out Utah addresses at database level (much faster than Python)
-    # This uses database-level regex for better performance
-    out_of_state_contributions = contributions.exclude(
-        Q(address__iregex=r',?\s+UT\s+\d{5}') |
-        Q(address__iregex=r',?\s+Utah\s+\d{5}') |
-        Q(address__iendswith=' UT') |
-        Q(address__iendswith=', UT')
+    # state / is_out_of_state are parsed from the address once, at import time
+    out_of_state_contributions = get_year_filtered_contributions(request).filter(
+        is_out_of_state=True
     )
 
-    # US state abbreviations
-    states = [
-        'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
-        'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
-        'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
-        'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
-        'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY', 'DC'
-    ]
-
-    # Pattern to find state abbreviation in address (end of string)
-    state_pattern = r'\b(' + '|'.join(states) + r')(?:\s+\d{5}(?:-\d{4})?)?\s*$'
-
-    # Group contributions by state
-    # NOTE: We still need Python loop here because SQLite doesn't have good regex extraction
-    # But we've reduced the dataset by filtering at database level first
-    state_data = {}
-
-    for contrib in out_of_state_contributions.only('address', 'amount', 'contributor_name'):
-        # Try to extract state from address
-        match = re.search(state_pattern, contrib.address, re.IGNORECASE)
-        if match:
-            state = match.group(1).upper()
-
-            # Only include non-Utah states (double-check)
-            if state != 'UT':
-                # Add to state totals
-                if state not in state_data:
-                    state_data[state] = {
-                        'state': state,
-                        'total_amount': Decimal('0'),
-                        'contribution_count': 0,
-                        'contributors': set()
-                    }
-
-                state_data[state]['total_amount'] += contrib.amount or Decimal('0')
-                state_data[state]['contribution_count'] += 1
-                state_data[state]['contributors'].add(contrib.contributor_name)
-
-    # Convert to list and calculate contributor counts
-    state_list = []
-    for state, data in state_data.items():
-        state_list.append({
-            'state': state,
-            'total_amount': data['total_amount'],
-            'contribution_count': data['contribution_count'],
-            'contributor_count': len(data['contributors'])
-        })
-
-    # Sort by total amount descending
-    state_list.sort(key=lambda x: x['total_amount'], reverse=True)
+    # Group contributions by state (single GROUP BY query)
+    state_list = list(
+        out_of_state_contributions
+        .values('state')
+        .annotate(
+            total_amount=Sum('amount'),
+            contribution_count=Count('id'),
+            contributor_count=Count('contributor_name', distinct=True)
+        )
+        .order_by('-total_amount')
+    )
 
     # Get top out-of-state contributors (database aggregation)
     top_out_of_state = (
@@ -868,102 +868,64 @@ def out_of_state(request):
 @ratelimit(key="ip", rate="100/h", method="GET")
 def api_out_of_state_map(request):
     """API endpoint for out-of-state contribution map data."""
-    from django.db.models import Sum, Value
-    from django.db.models.functions import Upper, Substr
-    import re
-
-    # Get year-filtered contributions that have addresses
-    contributions = get_year_filtered_contributions(request).exclude(address='')
-
-    # US state abbreviations (excluding UT)
-    out_of_state_codes = [
-        'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
-        'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
-        'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
-        'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
-        'SD', 'TN', 'TX', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY', 'DC'
-    ]
-
-    # Use database regex to filter - much faster than Python loops
-    # Pattern matches state code preceded by space/comma, followed by optional zip at end of address
-    # PostgreSQL-compatible: uses [,\s] instead of \b for word boundaries
-    state_pattern = r'[,\s](' + '|'.join(out_of_state_codes) + r')(?:\s+\d{5}(?:-\d{4})?)?\s*$'
-
-    # Filter contributions to those with out-of-state addresses
-    out_of_state_contribs = contributions.filter(address__iregex=state_pattern)
-
-    # Now extract states and aggregate in Python (smaller dataset after filtering)
-    state_data = {}
-    for contrib in out_of_state_contribs.values('address', 'amount'):
-        match = re.search(state_pattern, contrib['address'], re.IGNORECASE)
-        if match:
-            state = match.group(1).upper()
-            if state not in state_data:
-                state_data[state] = 0
-            state_data[state] += float(contrib['amount'] or 0)
+    state_totals = (
+        get_year_filtered_contributions(request)
+        .filter(is_out_of_state=True)
+        .values('state')
+        .annotate(total=Sum('amount'))
+        .order_by('-total')
+    )
 
     # Return as array of {state, amount} objects
     data = [
-        {'state': state, 'amount': amount}
-        for state, amount in state_data.items()
+        {'state': row['state'], 'amount': float(row['total'] or 0)}
+        for row in state_totals
     ]
 
-    return JsonResponse(data, safe=False)
+    return json_response(data)
 
 
 @ratelimit(key="ip", rate="100/h", method="GET")
 def api_state_contributions(request, state_code):
     """API endpoint to get all contributions from a specific state."""
-    from django.db.models import Sum, Q
-    import re
-
-    # Get year-filtered contributions with addresses
-    contributions = get_year_filtered_contributions(request).exclude(address='')
-
-    # US state abbreviations
-    states = [
-        'AL', 'AK', 'AZ', 'AR', 'CA', 'CO', 'CT', 'DE', 'FL', 'GA',
-        'HI', 'ID', 'IL', 'IN', 'IA', 'KS', 'KY', 'LA', 'ME', 'MD',
-        'MA', 'MI', 'MN', 'MS', 'MO', 'MT', 'NE', 'NV', 'NH', 'NJ',
-        'NM', 'NY', 'NC', 'ND', 'OH', 'OK', 'OR', 'PA', 'RI', 'SC',
-        'SD', 'TN', 'TX', 'UT', 'VT', 'VA', 'WA', 'WV', 'WI', 'WY', 'DC'
-    ]
-
-    # Pattern to find THIS specific state at end of address
-    # Use database regex first to narrow down results
-    state_pattern = r'\b' + state_code.upper() + r'(?:\s+\d{5}(?:-\d{4})?)?\s*$'
-
-    # Filter in database first (much faster than Python loop)
-    state_contributions = contributions.filter(
-        address__iregex=state_pattern
-    ).select_related('report').order_by('-date_received', '-amount')
-
-    # Calculate totals using database aggregation
-    aggregation = state_contributions.aggregate(
-        total_amount=Sum('amount'),
-        total_count=models.Count('id')
+    # Contributions from this state, via the state column parsed at import time
+    state_contributions = get_year_filtered_contributions(request).filter(
+        state=state_code.upper()
+    ).order_by('-date_received', '-amount')
+
+    # Top 100 for display, with the totals over every matching row computed by
+    # window functions in the same query (they run before the LIMIT)
+    rows = list(
+        state_contributions
+        .annotate(state_total=Window(Sum('amount')), state_count=Window(Count('id')))
+        .values_list(
+            'contributor_name', 'address', 'amount', 'date_received',
+            'report__organization_name', 'report__report_id', 'state_total', 'state_count',
+        )[:100]
     )
 
-    # Get top 100 for display
-    contributions_data = []
-    for contrib in state_contributions[:100]:
-        contributions_data.append({
-            'contributor_name': contrib.contributor_name,
-            'address': contrib.address,
-            'amount': float(contrib.amount) if contrib.amount else 0,
-            'date': contrib.date_received.strftime('%Y-%m-%d') if contrib.date_received else '',
-            'organization': contrib.report.organization_name if contrib.report else '',
-            'report_id': contrib.report.report_id if contrib.report else '',
-        })
+    contributions_data = [
+        {
+            'contributor_name': contributor_name,
+            'address': address,
+            'amount': float(amount) if amount else 0,
+            'date': date_received.strftime('%Y-%m-%d') if date_received else '',
+            'organization': organization_name,
+            'report_id': report_id,
+        }
+        for contributor_name, address, amount, date_received, organization_name, report_id, _, _ in rows
+    ]
+    total_amount, total_count = rows[0][6:] if rows else (0, 0)
 
-    return JsonResponse({
+    return json_response({
         'state': state_code,
         'contributions': contributions_data,
-        'total_amount': float(aggregation['total_amount'] or 0),
-        'total_count': aggregation['total_count'] or 0,
+        'total_amount': float(total_amount or 0),
+        'total_count': total_count,
     })
 
 
+@cache_page(SEARCH_CACHE_SECONDS)
 def global_search(request):
     """Global search across all data."""
     query = request.GET.get('q', '').strip()
@@ -982,22 +944,25 @@ def global_search(request):
     # Import the models we need
     from .models import EntityRegistration
 
+    # Each bucket is evaluated once here; the totals and the template reuse the rows.
+    # On PostgreSQL every searched column has a trigram index, so icontains is indexed.
+
     # Search reports
-    reports = DisclosureReport.objects.filter(
+    reports = list(DisclosureReport.objects.filter(
         Q(report_id__icontains=query) |
         Q(title__icontains=query) |
         Q(organization_name__icontains=query)
-    )[:20]
+    )[:20])
 
     # Search entities
-    entities = EntityRegistration.objects.filter(
+    entities = list(EntityRegistration.objects.filter(
         Q(entity_id__icontains=query) |
         Q(name__icontains=query) |
         Q(also_known_as__icontains=query)
-    )[:20]
+    )[:20])
 
     # Search contributors
-    contributors = (
+    contributors = list(
         Contribution.objects
         .filter(
             Q(contributor_name__icontains=query) |
@@ -1012,7 +977,7 @@ def global_search(request):
     )
 
     # Search expenditures
-    expenditures = (
+    expenditures = list(
         Expenditure.objects
         .filter(
             Q(recipient_name__icontains=query) |
@@ -1026,12 +991,7 @@ def global_search(request):
         .order_by('-total_amount')[:20]
     )
 
-    total_results = (
-        reports.count() +
-        entities.count() +
-        len(contributors) +
-        len(expenditures)
-    )
+    total_results = len(reports) + len(entities) + len(contributors) + len(expenditures)
 
     context = {
         'query': query,
@@ -1070,7 +1030,7 @@ def candidates_list(request):
     )
 
     # Pagination
-    paginator = Paginator(candidates, 50)
+    paginator = CachedCountPaginator(candidates, 50)
     page_number = request.GET.get('page')
     page_obj = paginator.get_page(page_number)
 
@@ -1162,13 +1122,19 @@ def candidate_detail(request, candidate_name):
         .order_by('month')
     )
 
-    # Summary statistics
+    # Summary statistics: one aggregate query per table instead of one per figure
+    contrib_totals = contributions.aggregate(
+        total=Sum('amount'),
+        count=Count('id'),
+        contributors=Count('contributor_name', distinct=True),
+    )
+    exp_totals = expenditures.aggregate(total=Sum('amount'), count=Count('id'))
     stats = {
-        'total_raised': contributions.aggregate(total=Sum('amount'))['total'] or Decimal('0'),
-        'total_spent': expenditures.aggregate(total=Sum('amount'))['total'] or Decimal('0'),
-        'contribution_count': contributions.count(),
-        'expenditure_count': expenditures.count(),
-        'contributor_count': contributions.values('contributor_name').distinct().count(),
+        'total_raised': contrib_totals['total'] or Decimal('0'),
+        'total_spent': exp_totals['total'] or Decimal('0'),
+        'contribution_count': contrib_totals['count'],
+        'expenditure_count': exp_totals['count'],
+        'contributor_count': contrib_totals['contributors'],
         'report_count': candidate_reports.count(),
     }
 
@@ -1200,16 +1166,17 @@ def candidate_detail(request, candidate_name):
     parties = []
     counties = []
 
-    for report in candidate_reports:
-        if report.report_info:
-            if 'Office' in report.report_info:
-                offices.append(report.report_info['Office'])
-            if 'District' in report.report_info:
-                districts.append(report.report_info['District'])
-            if 'Party' in report.report_info:
-                parties.append(report.report_info['Party'])
-            if 'County' in report.report_info:
-                counties.append(report.report_info['County'])
+    # These report_info keys are also stored as columns, so no JSON is read here
+    report_offices = candidate_reports.values_list('office', 'district', 'party', 'county')
+    for office, district, party, county in report_offices:
+        if office is not None:
+            offices.append(office)
+        if district is not None:
+            districts.append(district)
+        if party is not None:
+            parties.append(party)
+        if county is not None:
+            counties.append(county)
 
     # Get most common values and track all unique offices
     office_info = {}
@@ -1246,7 +1213,7 @@ def candidate_detail(request, candidate_name):
     context = {
         'candidate_name': candidate_name,
         'reports': candidate_reports[:10],  # Show latest 10 reports
-        'all_reports_count': candidate_reports.count(),
+        'all_reports_count': stats['report_count'],
         'top_contributors': top_contributors,
         'top_expenditures': top_expenditures,
         'monthly_contributions': monthly_contributions,
@@ -1260,6 +1227,37 @@ def candidate_detail(request, candidate_name):
     return render(request, 'disclosures/candidate_detail.html', context)
 
 
+def pac_name_matcher(reports):
+    """
+    Return a function mapping a contributor name to the names of the PACs in reports
+    it refers to, newest report first: an exact organization_name match, or else
+    every PAC whose name contains each significant word of the contributor name
+    (the same test as chaining organization_name__icontains). Costs one query.
+    """
+    pac_names = [
+        row['organization_name'] for row in
+        reports
+        .filter(organization_type__icontains='Political Action Committee')
+        .values('organization_name')
+        .annotate(latest=Max('created_at'))
+        .order_by('-latest')
+    ]
+    exact_names = set(pac_names)
+    lower_names = [(name, name.lower()) for name in pac_names]
+
+    def match(contrib_name):
+        if contrib_name in exact_names:
+            return (contrib_name,)
+        clean_name = contrib_name.replace(' PAC', '').replace(' Committee', '').replace(' Fund', '').strip()
+        # Only words longer than 2 chars
+        words = [w.lower() for w in clean_name.split() if len(w) > 2]
+        if not words:
+            return ()
+        return tuple(name for name, lower in lower_names if all(w in lower for w in words))
+
+    return match
+
+
 def api_candidate_sankey(request, candidate_name):
     """API endpoint for Candidate Sankey diagram showing: Contributors → Candidate and Contributors → PAC → Candidate."""
     candidate_name = unquote(candidate_name)
@@ -1285,34 +1283,16 @@ def api_candidate_sankey(request, candidate_name):
 
     # Identify PACs that contributed to the candidate
     # Check if contributor has reports filed as a PAC (more reliable than name matching)
+    match_pacs = pac_name_matcher(reports)
     pac_contributors = []
     non_pac_contributors = []
 
     for contrib in direct_contributions:
-        contrib_name = contrib['contributor_name']
-
-        # Check if this contributor has reports filed as a PAC
-        # Try exact match first
-        has_pac_reports = reports.filter(
-            organization_name=contrib_name,
-            organization_type__icontains='Political Action Committee'
-        ).exists()
-
-        # If no exact match, try fuzzy matching by removing common suffixes and matching on key words
-        if not has_pac_reports:
-            from django.db.models import Q
-            clean_name = contrib_name.replace(' PAC', '').replace(' Committee', '').replace(' Fund', '').strip()
-
-            # Split into words and create a query that matches all significant words
-            words = [w for w in clean_name.split() if len(w) > 2]  # Only words longer than 2 chars
-            if words:
-                q = Q(organization_type__icontains='Political Action Committee')
-                for word in words:
-                    q &= Q(organization_name__icontains=word)
-                has_pac_reports = reports.filter(q).exists()
-
-        if has_pac_reports:
-            pac_contributors.append(contrib)
+        # Handle cases where contributor name might be "Friends of Gary Herbert PAC"
+        # but org name is "Friends Of Gary R. Herbert"
+        pac_names = match_pacs(contrib['contributor_name'])
+        if pac_names:
+            pac_contributors.append((contrib, pac_names))
         else:
             non_pac_contributors.append(contrib)
 
@@ -1324,52 +1304,33 @@ def api_candidate_sankey(request, candidate_name):
 
     # For each PAC that contributed to the candidate, get its contributors
     pac_contributor_data = {}
-    for pac_contrib in pac_contributors:
+    for pac_contrib, pac_names in pac_contributors:
         pac_name = pac_contrib['contributor_name']
 
-        # Get reports for this PAC - try exact match first, then fuzzy match
-        # Handle cases where contributor name might be "Friends of Gary Herbert PAC"
-        # but org name is "Friends Of Gary R. Herbert"
-        pac_reports = reports.filter(
-            organization_name=pac_name,
-            organization_type__icontains='Political Action Committee'
-        )
-
-        # If no exact match, try fuzzy matching using key words
-        if not pac_reports.exists():
-            from django.db.models import Q
-            clean_name = pac_name.replace(' PAC', '').replace(' Committee', '').replace(' Fund', '').strip()
-
-            # Split into words and create a query that matches all significant words
-            words = [w for w in clean_name.split() if len(w) > 2]
-            if words:
-                q = Q(organization_type__icontains='Political Action Committee')
-                for word in words:
-                    q &= Q(organization_name__icontains=word)
-                pac_reports = reports.filter(q)
-
-        if pac_reports.exists():
-            # Use the actual organization name from the reports (not the contributor name)
-            # This avoids duplication when multiple contributor names match the same PAC
-            actual_pac_name = pac_reports.first().organization_name
-
-            # Only add if we haven't already processed this PAC
-            if actual_pac_name not in pac_contributor_data:
-                # Get top 5 contributors to this PAC
-                pac_contributors_list = list(
-                    get_year_filtered_contributions(request)
-                    .filter(report__in=pac_reports)
-                    .exclude(contributor_name__in=[pac_name, candidate_name, actual_pac_name])
-                    .values('contributor_name')
-                    .annotate(total=Sum('amount'))
-                    .order_by('-total')[:5]
+        # Use the actual organization name from the reports (not the contributor name)
+        # This avoids duplication when multiple contributor names match the same PAC
+        actual_pac_name = pac_names[0]
+
+        # Only add if we haven't already processed this PAC
+        if actual_pac_name not in pac_contributor_data:
+            # Get top 5 contributors to this PAC
+            pac_contributors_list = list(
+                get_year_filtered_contributions(request)
+                .filter(
+                    report__organization_name__in=pac_names,
+                    report__organization_type__icontains='Political Action Committee'
                 )
-                if pac_contributors_list:
-                    # Store using actual PAC name and include the original contributor name and amount
-                    pac_contributor_data[actual_pac_name] = {
-                        'contributors': pac_contributors_list,
-                        'contribution_to_candidate': pac_contrib['total']
-                    }
+                .exclude(contributor_name__in=[pac_name, candidate_name, actual_pac_name])
+                .values('contributor_name')
+                .annotate(total=Sum('amount'))
+                .order_by('-total')[:5]
+            )
+            if pac_contributors_list:
+                # Store using actual PAC name and include the original contributor name and amount
+                pac_contributor_data[actual_pac_name] = {
+                    'contributors': pac_contributors_list,
+                    'contribution_to_candidate': pac_contrib['total']
+                }
 
     # Add contributor nodes to PACs (leftmost layer)
     for pac_name, pac_data in pac_contributor_data.items():
@@ -1433,29 +1394,47 @@ def api_candidate_sankey(request, candidate_name):
         'links': links
     }
 
-    return JsonResponse(data)
+    return json_response(data)
+
+
+# State code pattern: 2 uppercase letters followed by optional space and zip
+# Common patterns: "UT 84116", "UT84116", ", UT 84116", "Utah 84116"
+_COMMA_STATE_ZIP_RE = re.compile(r',\s*([A-Z]{2})\s+\d{5}')
+_STATE_ZIP_RE = re.compile(r'\b([A-Z]{2})\s*\d{5}')
+
 
 def extract_state_from_address(address):
     """Extract state code from address string."""
     if not address:
         return None
 
-    import re
-    # Look for state code pattern: 2 uppercase letters followed by optional space and zip
-    # Common patterns: "UT 84116", "UT84116", ", UT 84116", "Utah 84116"
-    match = re.search(r',\s*([A-Z]{2})\s+\d{5}', address)
+    match = _COMMA_STATE_ZIP_RE.search(address)
     if match:
         return match.group(1)
 
     # Try end of string
-    match = re.search(r'\b([A-Z]{2})\s*\d{5}', address)
+    match = _STATE_ZIP_RE.search(address)
     if match:
         return match.group(1)
 
     return None
 
 
+# Positions in an [in-state, out-of-state, unknown] list of totals
+INSTATE, OUTSTATE, UNKNOWN = 0, 1, 2
+
+
+@lru_cache(maxsize=4096)
+def state_bucket(address):
+    """Which of the in-state / out-of-state / unknown totals an address counts toward (cached: donors repeat)."""
+    state = extract_state_from_address(address)
+    if state == 'UT':
+        return INSTATE
+    return OUTSTATE if state else UNKNOWN
+
+
 @ratelimit(key='ip', rate='100/m', method='GET')
+@cache_page(PAGE_CACHE_SECONDS)
 def api_pac_instate_percentage(request, organization_name):
     """API endpoint for PAC in-state contribution percentage."""
     organization_name = unquote(organization_name)
@@ -1468,26 +1447,22 @@ def api_pac_instate_percentage(request, organization_name):
     )
 
     if not pac_reports.exists():
-        return JsonResponse({'error': 'PAC not found'}, status=404)
+        return json_response({'error': 'PAC not found'}, status=404)
 
-    # Get all contributions to this PAC
-    contributions = get_year_filtered_contributions(request).filter(
-        report__in=pac_reports
+    # Contributions to this PAC, summed per address in the database so each distinct
+    # address is parsed once and no model instances are built
+    contributions = (
+        get_year_filtered_contributions(request)
+        .filter(report__in=pac_reports)
+        .values_list('address')
+        .annotate(total=Sum('amount'))
     )
 
     # Calculate in-state vs out-of-state
-    instate_total = Decimal('0')
-    outstate_total = Decimal('0')
-    unknown_total = Decimal('0')
-
-    for contrib in contributions:
-        state = extract_state_from_address(contrib.address)
-        if state == 'UT':
-            instate_total += contrib.amount
-        elif state:
-            outstate_total += contrib.amount
-        else:
-            unknown_total += contrib.amount
+    totals = [Decimal('0')] * 3
+    for address, amount in contributions.iterator(chunk_size=2000):
+        totals[state_bucket(address)] += amount
+    instate_total, outstate_total, unknown_total = totals
 
     total = instate_total + outstate_total + unknown_total
 
@@ -1500,7 +1475,7 @@ def api_pac_instate_percentage(request, organization_name):
         outstate_percentage = float((outstate_total / total) * 100)
         unknown_percentage = float((unknown_total / total) * 100)
 
-    return JsonResponse({
+    return json_response({
         'instate_percentage': round(instate_percentage, 1),
         'outstate_percentage': round(outstate_percentage, 1),
         'unknown_percentage': round(unknown_percentage, 1),
@@ -1512,6 +1487,7 @@ def api_pac_instate_percentage(request, organization_name):
 
 
 @ratelimit(key='ip', rate='100/m', method='GET')
+@cache_page(PAGE_CACHE_SECONDS)
 def api_candidate_instate_percentage(request, candidate_name):
     """
     API endpoint for candidate in-state contribution percentage.
@@ -1527,58 +1503,58 @@ def api_candidate_instate_percentage(request, candidate_name):
     )
 
     if not candidate_reports.exists():
-        return JsonResponse({'error': 'Candidate not found'}, status=404)
+        return json_response({'error': 'Candidate not found'}, status=404)
 
     # Get all contributions to candidate
-    contributions = get_year_filtered_contributions(request).filter(
-        report__in=candidate_reports
+    contributions = list(
+        get_year_filtered_contributions(request)
+        .filter(report__in=candidate_reports)
+        .values_list('contributor_name', 'address', 'amount')
     )
 
+    # Every PAC filing in the selected year, fetched once rather than looked up
+    # (exact, then fuzzy) with a query or two per contribution
+    match_pacs = pac_name_matcher(reports)
+    contributor_pacs = {name: match_pacs(name) for name in {c[0] for c in contributions}}
+
+    # In-state / out-of-state / unknown totals of each matched PAC's own contributions,
+    # in one query grouped by PAC and address
+    pac_buckets = {}
+    matched_pacs = set().union(*contributor_pacs.values())
+    if matched_pacs:
+        pac_rows = (
+            get_year_filtered_contributions(request)
+            .filter(
+                report__organization_name__in=matched_pacs,
+                report__organization_type__icontains='Political Action Committee'
+            )
+            .values_list('report__organization_name', 'address')
+            .annotate(total=Sum('amount'))
+        )
+        for pac_name, address, amount in pac_rows.iterator(chunk_size=2000):
+            buckets = pac_buckets.setdefault(pac_name, [Decimal('0')] * 3)
+            buckets[state_bucket(address)] += amount
+
+    # Combined totals per contributor name (a fuzzy match can cover several PACs)
+    contributor_buckets = {}
+    for contrib_name, pacs in contributor_pacs.items():
+        if pacs:
+            totals = [Decimal('0')] * 3
+            for pac_name in pacs:
+                for i, amount in enumerate(pac_buckets.get(pac_name, ())):
+                    totals[i] += amount
+            contributor_buckets[contrib_name] = totals
+
     # Track weighted totals
     instate_total = Decimal('0')
     outstate_total = Decimal('0')
     unknown_total = Decimal('0')
 
-    for contrib in contributions:
-        contrib_name = contrib.contributor_name
-        contrib_amount = contrib.amount
-
-        # Check if this contributor is a PAC
-        # Try exact match first
-        pac_reports = reports.filter(
-            organization_name=contrib_name,
-            organization_type__icontains='Political Action Committee'
-        )
-
-        # If no exact match, try fuzzy matching
-        if not pac_reports.exists():
-            clean_name = contrib_name.replace(' PAC', '').replace(' Committee', '').replace(' Fund', '').strip()
-            words = [w for w in clean_name.split() if len(w) > 2]
-            if words:
-                q = Q(organization_type__icontains='Political Action Committee')
-                for word in words:
-                    q &= Q(organization_name__icontains=word)
-                pac_reports = reports.filter(q)
-
-        if pac_reports.exists():
-            # This is a PAC - get the PAC's in-state percentage
-            pac_contributions = get_year_filtered_contributions(request).filter(
-                report__in=pac_reports
-            )
-
-            pac_instate = Decimal('0')
-            pac_outstate = Decimal('0')
-            pac_unknown = Decimal('0')
-
-            for pac_contrib in pac_contributions:
-                state = extract_state_from_address(pac_contrib.address)
-                if state == 'UT':
-                    pac_instate += pac_contrib.amount
-                elif state:
-                    pac_outstate += pac_contrib.amount
-                else:
-                    pac_unknown += pac_contrib.amount
-
+    for contrib_name, address, contrib_amount in contributions:
+        pac_totals = contributor_buckets.get(contrib_name)
+        if pac_totals is not None:
+            # This is a PAC - weight the contribution by the PAC's in-state percentage
+            pac_instate, pac_outstate, pac_unknown = pac_totals
             pac_total = pac_instate + pac_outstate + pac_unknown
 
             if pac_total > 0:
@@ -1591,10 +1567,10 @@ def api_candidate_instate_percentage(request, candidate_name):
                 unknown_total += contrib_amount
         else:
             # Direct contribution - check state
-            state = extract_state_from_address(contrib.address)
-            if state == 'UT':
+            bucket = state_bucket(address)
+            if bucket == INSTATE:
                 instate_total += contrib_amount
-            elif state:
+            elif bucket == OUTSTATE:
                 outstate_total += contrib_amount
             else:
                 unknown_total += contrib_amount
@@ -1610,7 +1586,7 @@ def api_candidate_instate_percentage(request, candidate_name):
         outstate_percentage = float((outstate_total / total) * 100)
         unknown_percentage = float((unknown_total / total) * 100)
 
-    return JsonResponse({
+    return json_response({
         'instate_percentage': round(instate_percentage, 1),
         'outstate_percentage': round(outstate_percentage, 1),
         'unknown_percentage': round(unknown_percentage, 1),
@@ -73,6 +73,11 @@ if config('DB_NAME', default=None):
             'PASSWORD': config('DB_PASSWORD', default=''),
             'HOST': config('DB_HOST', default='localhost'),
             'PORT': config('DB_PORT', default='5432'),
+            # Keep connections open across requests instead of reconnecting each time
+            'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=60, cast=int),
+            'CONN_HEALTH_CHECKS': True,
+            # Required behind PgBouncer in transaction pooling mode
+            'DISABLE_SERVER_SIDE_CURSORS': config('DB_DISABLE_SERVER_SIDE_CURSORS', default=False, cast=bool),
         }
     }
 else:
@@ -81,6 +86,8 @@ else:
         'default': {
             'ENGINE': 'django.db.backends.sqlite3',
             'NAME': BASE_DIR / 'db.sqlite3',
+            # Reusing the connection also skips re-running the PRAGMAs below
+            'CONN_MAX_AGE': config('DB_CONN_MAX_AGE', default=60, cast=int),
         }
     }
 
@@ -133,7 +140,7 @@ STATICFILES_DIRS = [
 # Default primary key field type
 DEFAULT_AUTO_FIELD = 'django.db.models.BigAutoField'
 
-# Cache configuration for rate limiting
+# Cache configuration for rate limiting and the cached index/about pages
 CACHES = {
     'default': {
         'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
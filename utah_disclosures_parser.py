@@ -7,7 +7,9 @@ and converts the table data into structured JSON format.
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
 import json
 import re
 import os
@@ -17,6 +19,15 @@ from decouple import config
 # Load custom User-Agent from environment (defaults to a descriptive bot identifier)
 USER_AGENT = config('USER_AGENT', default='PolStatsBot/1.0 (Utah Political Finance Data Aggregator)')
 
+# Keep-alive session reused across reports so each fetch skips the TCP/TLS handshake
+SESSION = requests.Session()
+SESSION.mount('https://', HTTPAdapter(
+    pool_connections=1,
+    pool_maxsize=16,
+    max_retries=Retry(total=3, backoff_factor=0.5, status_forcelist=(500, 502, 503, 504)),
+))
+SESSION.headers.update({'User-Agent': USER_AGENT, 'Accept-Encoding': 'gzip, deflate'})
+
 
 def parse_currency(value: str) -> float:
     """Convert currency string to float."""
@@ -289,25 +300,48 @@ def parse_report_info(soup: BeautifulSoup) -> Dict[str, str]:
     return info
 
 
-def parse_utah_disclosure(url: str) -> Dict[str, Any]:
+def parse_report_type_html(html: bytes) -> Dict[str, str]:
+    """
+    Parse only the report title and organization type from a report page.
+
+    Both come from the <title> and <legend> elements, so the rest of the
+    page (including the transaction tables) is never built into the tree.
+    """
+    soup = BeautifulSoup(html, 'html.parser', parse_only=SoupStrainer(['title', 'legend']))
+    return parse_report_info(soup)
+
+
+def parse_utah_disclosure(url: str, session: requests.Session = None) -> Dict[str, Any]:
     """
     Main parser function that fetches and parses a Utah disclosure report.
 
     Args:
         url: URL of the disclosure report
+        session: Session to fetch with (defaults to the module-level SESSION)
 
     Returns:
         Dictionary containing all parsed data in structured format
     """
-    # Fetch the page with custom User-Agent
-    headers = {
-        'User-Agent': USER_AGENT
-    }
-    response = requests.get(url, headers=headers)
+    # Fetch the page over a pooled session (User-Agent is set on the session)
+    response = (session or SESSION).get(url, timeout=30)
     response.raise_for_status()
 
+    return parse_disclosure_html(response.content, url)
+
+
+def parse_disclosure_html(html: bytes, url: str) -> Dict[str, Any]:
+    """
+    Parse an already-fetched Utah disclosure report page.
+
+    Args:
+        html: Page body
+        url: URL the page was fetched from
+
+    Returns:
+        Dictionary containing all parsed data in structured format
+    """
     # Parse with BeautifulSoup
-    soup = BeautifulSoup(response.content, 'html.parser')
+    soup = BeautifulSoup(html, 'html.parser')
 
     # Extract all data
     data = {